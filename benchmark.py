@@ -0,0 +1,500 @@
+"""Performance benchmarks for the Employee Management System.
+
+Usage:
+    python benchmark.py queue [--sizes 1000,10000,100000]
+    python benchmark.py lookup [--employees 100000]
+    python benchmark.py codec [--repeat 5000]
+    python benchmark.py memory [--employees 100000]
+    python benchmark.py tree [--employees 500000] [--departments 10000]
+    python benchmark.py sort [--sizes 10000,100000,1000000]
+    python benchmark.py logparse [--lines 1000000]
+    python benchmark.py report [--employees 100000]
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+import part2
+from part2 import (Employee, EmployeeManagementSystem, EmployeeRequest, EmployeeStore, EmployeeTree,
+                   PriorityQueue)
+
+REQUEST_TYPES = ["Logistics", "Maintenance", "Support", "Technical", "IT", "Others"]
+DEPARTMENTS = ["HR", "IT", "Finance", "Marketing", "Operations", "Sales", "Legal", "R&D"]
+PROGRAMMES = ["Leadership Skills", "Python Basics", "Data Analysis", "Project Management",
+              "Cyber Security", "Public Speaking", "Advanced Excel Training", "Customer Service"]
+
+
+def _timed(func, *args):
+    """Run func with stdout silenced and return (seconds, result)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+    return elapsed, result
+
+
+def make_requests(n, seed=42):
+    rng = random.Random(seed)
+    base = datetime.datetime(2025, 1, 1)
+    requests = []
+    for i in range(n):
+        req = EmployeeRequest(10001 + rng.randrange(20), rng.choice(REQUEST_TYPES),
+                              rng.randint(1, 5), f"Benchmark request {i}")
+        req.timestamp = base + datetime.timedelta(seconds=rng.randrange(10 ** 7))
+        requests.append(req)
+    return requests
+
+
+def make_employees(n, seed=42):
+    rng = random.Random(seed)
+    return [Employee(f"Employee {i:07d}", 10001 + i, f"employee{i}@company.com",
+                     rng.choice(DEPARTMENTS), rng.random() < 0.7, str(rng.randrange(30000, 120000)),
+                     rng.sample(PROGRAMMES, rng.randint(0, 4)))
+            for i in range(n)]
+
+
+def make_system(employees=()):
+    """An EmployeeManagementSystem rooted in an empty temp directory"""
+    os.chdir(tempfile.mkdtemp(prefix="ems-bench-"))
+    with contextlib.redirect_stdout(io.StringIO()):
+        system = EmployeeManagementSystem()
+    for emp in employees:
+        system.add_employee(emp)
+    return system
+
+
+# ---------------------------------------------------------------- queue
+class ListPriorityQueue:
+    """The original sort-on-insert list queue, kept here for comparison"""
+
+    def __init__(self):
+        self.requests = []
+
+    def add_request(self, request):
+        self.requests.append(request)
+        self.requests.sort()
+
+    def process_next(self):
+        return self.requests.pop(0) if self.requests else None
+
+    def remove_request(self, request):
+        self.requests.remove(request)
+
+
+def _queue_workload(queue_cls, requests):
+    queue = queue_cls()
+    for req in requests:
+        queue.add_request(req)
+    # Remove every tenth request by reference, then drain the rest
+    for req in requests[::10]:
+        queue.remove_request(req)
+    while queue.process_next() is not None:
+        pass
+
+
+def bench_queue(sizes, legacy_limit):
+    print(f"{'Requests':>10}{'List queue (s)':>18}{'Heap queue (s)':>18}{'Speed-up':>10}")
+    for n in sizes:
+        requests = make_requests(n)
+        heap_time, _ = _timed(_queue_workload, PriorityQueue, requests)
+        if n <= legacy_limit:
+            list_time, _ = _timed(_queue_workload, ListPriorityQueue, requests)
+            print(f"{n:>10}{list_time:>18.4f}{heap_time:>18.4f}{list_time / heap_time:>9.1f}x")
+        else:
+            print(f"{n:>10}{'skipped':>18}{heap_time:>18.4f}{'-':>10}")
+
+
+# ---------------------------------------------------------------- lookup
+def bench_lookup(n_employees, n_lookups=2000):
+    system = make_system(make_employees(n_employees))
+    rng = random.Random(7)
+    ids = [10001 + rng.randrange(n_employees) for _ in range(n_lookups)]
+
+    def linear():
+        for emp_id in ids:
+            next((emp for emp in system.employees if emp.employee_id == emp_id), None)
+
+    def indexed():
+        for emp_id in ids:
+            system.get_employee(emp_id)
+
+    linear_time, _ = _timed(linear)
+    indexed_time, _ = _timed(indexed)
+    print(f"{n_employees} employees, {n_lookups} lookups")
+    print(f"  linear scan : {linear_time / n_lookups * 1e6:12.2f} us/lookup")
+    print(f"  id index    : {indexed_time / n_lookups * 1e6:12.2f} us/lookup")
+
+
+# ---------------------------------------------------------------- codec
+def legacy_encrypt(data, key=5):
+    encrypted = ""
+    for char in str(data):
+        encrypted += chr(ord(char) + key)
+    return encrypted
+
+
+def legacy_decrypt(encrypted, key=5):
+    decrypted = ""
+    for char in encrypted:
+        decrypted += chr(ord(char) - key)
+    return decrypted
+
+
+def _load_save_cycle(system, data):
+    system._process_json_data(data)
+    snapshot = {
+        "employees": system._employees_to_dicts(system.employees),
+        "requests": [system._request_to_dict(req) for req in system.request_queue.requests],
+    }
+    return json.dumps(snapshot)
+
+
+def bench_codec(source, repeat):
+    with open(source) as f:
+        data = json.load(f)
+    data["employees"] = data["employees"] * repeat
+    data["requests"] = data["requests"] * repeat
+    print(f"{len(data['employees'])} employees, {len(data['requests'])} requests ({source} x{repeat})")
+
+    system = make_system()
+    new_time, new_out = _timed(_load_save_cycle, system, data)
+
+    fast = part2.simple_encrypt, part2.simple_decrypt, part2.simple_encrypt_many, part2.simple_decrypt_many
+    part2.simple_encrypt, part2.simple_decrypt = legacy_encrypt, legacy_decrypt
+    part2.simple_encrypt_many = lambda values, key=5: [legacy_encrypt(v, key) for v in values]
+    part2.simple_decrypt_many = lambda values, key=5: [legacy_decrypt(v, key) for v in values]
+    try:
+        old_time, old_out = _timed(_load_save_cycle, system, data)
+    finally:
+        (part2.simple_encrypt, part2.simple_decrypt,
+         part2.simple_encrypt_many, part2.simple_decrypt_many) = fast
+
+    print(f"  per-char += codec : {old_time:8.3f} s")
+    print(f"  translate codec   : {new_time:8.3f} s  ({old_time / new_time:.1f}x)")
+    print(f"  identical output  : {old_out == new_out}")
+
+
+# ---------------------------------------------------------------- memory
+class _DictLinkedList:
+    def __init__(self):
+        self.head = None
+
+
+class DictEmployee:
+    """The original __dict__-based Employee layout, kept here for comparison"""
+
+    def __init__(self, name, employee_id, email, department, is_full_time, salary="50000",
+                 programmes=None, is_admin=False):
+        self.employee_id = employee_id
+        self.department = department
+        self.is_full_time = is_full_time
+        self.programmes = programmes if programmes else []
+        self.enrollment_history = _DictLinkedList()
+        self.is_admin = is_admin
+        self._name = name
+        self._email = email
+        self._salary = salary
+
+
+def _traced_bytes(build):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return after - before, result
+
+
+def bench_memory(n):
+    # Field values are built up front so every layout shares the same strings
+    source = make_employees(n)
+    rows = [(e.name, e.employee_id, e.email, e.department, e.is_full_time, e.salary, list(e.programmes))
+            for e in source]
+    del source
+
+    dict_bytes, _ = _traced_bytes(lambda: [DictEmployee(*row) for row in rows])
+    slot_bytes, slotted = _traced_bytes(lambda: [Employee(*row) for row in rows])
+    store_bytes, _ = _traced_bytes(lambda: EmployeeStore.from_employees(slotted))
+
+    print(f"{n} employees (bytes/employee, excluding shared field strings)")
+    print(f"  __dict__ Employee : {dict_bytes / n:10.1f}")
+    print(f"  slotted Employee  : {slot_bytes / n:10.1f}")
+    print(f"  EmployeeStore     : {store_bytes / n:10.1f}")
+
+
+# ---------------------------------------------------------------- tree
+def make_org_chart(n_departments, seed=42):
+    """(department, parent) pairs: a deep spine plus randomly attached branches"""
+    rng = random.Random(seed)
+    names = ["Organization"]
+    spine = "Organization"
+    pairs = []
+    for i in range(n_departments):
+        name = f"Dept {i:05d}"
+        # Every fourth department extends the spine so the chart is thousands of levels deep
+        if i % 4 == 0:
+            parent, spine = spine, name
+        else:
+            parent = rng.choice(names)
+        pairs.append((name, parent))
+        names.append(name)
+    return pairs
+
+
+def _build_tree(pairs, employees):
+    tree = EmployeeTree()
+    for name, parent in pairs:
+        tree.add_department(name, parent)
+    for i, emp in enumerate(employees):
+        tree.add_employee(emp, pairs[i % len(pairs)][0])
+    return tree
+
+
+def bench_tree(n_employees, n_departments):
+    pairs = make_org_chart(n_departments)
+    employees = make_employees(n_employees)
+    build_time, tree = _timed(_build_tree, pairs, employees)
+    walk_time, _ = _timed(lambda: tree.get_all_employees())
+    rollup_time, _ = _timed(tree.rollup)  # First read pays for the post-order pass
+    depth = max(level for _, level in tree._walk())
+    print(f"{n_employees} employees across {n_departments} departments (max depth {depth})")
+    print(f"  build_tree         : {build_time:8.3f} s")
+    print(f"  get_all_employees  : {walk_time:8.3f} s")
+    print(f"  rollup             : {rollup_time:8.3f} s")
+
+
+# ---------------------------------------------------------------- sort
+def legacy_quick_sort_by_department(employees):
+    """The original recursive three-list quick sort, kept here for comparison"""
+    employees = [emp for emp in employees if not emp.is_admin]
+
+    def _quicksort(arr):
+        if len(arr) <= 1:
+            return arr
+        pivot = arr[len(arr) // 2]
+        left, middle, right = [], [], []
+        for emp in arr:
+            if emp.department.lower() < pivot.department.lower():
+                left.append(emp)
+            elif emp.department.lower() > pivot.department.lower():
+                right.append(emp)
+            elif emp.name.lower() < pivot.name.lower():
+                left.append(emp)
+            elif emp.name.lower() > pivot.name.lower():
+                right.append(emp)
+            else:
+                middle.append(emp)
+        return _quicksort(left) + middle + _quicksort(right)
+
+    return _quicksort(employees)
+
+
+def bench_sort(sizes, legacy_limit):
+    print(f"{'Employees':>10}{'legacy (s)':>13}{'timsort (s)':>13}{'quicksort (s)':>15}{'columnar (s)':>14}"
+          f"{'cached (s)':>12}")
+    for n in sizes:
+        system = make_system(make_employees(n))
+        # Names are generated in order, which drives the legacy sort into deep recursion
+        random.Random(n).shuffle(system.employees)
+        if n <= legacy_limit:
+            legacy = f"{_timed(legacy_quick_sort_by_department, system.employees)[0]:13.3f}"
+        else:
+            legacy = f"{'skipped':>13}"
+        quick_time, _ = _timed(system.quick_sort_by_department, "quicksort")
+        tim_time, _ = _timed(system.quick_sort_by_department, "timsort")
+        columnar_time, _ = _timed(system.quick_sort_by_department, "columnar")
+        _timed(system.quick_sort_by_department)  # Materializes the view
+        cached_time, _ = _timed(system.quick_sort_by_department)
+        print(f"{n:>10}{legacy}{tim_time:13.3f}{quick_time:15.3f}{columnar_time:14.3f}{cached_time:12.3f}")
+
+
+# ---------------------------------------------------------------- logparse
+def legacy_parse_log(path):
+    """The original find()/strptime line parser, kept here for comparison"""
+    processed = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            timestamp_end = line.find(': ')
+            if timestamp_end == -1:
+                continue
+            timestamp_str, request_data = line[:timestamp_end], line[timestamp_end + 2:]
+            try:
+                timestamp = datetime.datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S.%f")
+            except ValueError:
+                try:
+                    timestamp = datetime.datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
+                except ValueError:
+                    continue
+            if not (request_data.startswith("APPROVED: ") or request_data.startswith("REJECTED: ")):
+                continue
+            status, request_str = request_data.split(': ', 1)
+            try:
+                id_start = request_str.find("ID: ") + 4
+                employee_id = int(request_str[id_start:request_str.find(",", id_start)])
+                type_start = request_str.find("Type: ") + 6
+                request_type = request_str[type_start:request_str.find(",", type_start)].strip()
+                priority_start = request_str.find("Priority: ") + 10
+                priority = int(request_str[priority_start:request_str.find(",", priority_start)])
+                details_start = request_str.find("Details: ") + 9
+                details_end = request_str.find(", Time:", details_start)
+                details = request_str[details_start:details_end].strip()
+                request_time_str = request_str[details_end + 7:].strip().rstrip(']')
+                try:
+                    request_time = datetime.datetime.strptime(request_time_str, "%Y-%m-%d %H:%M:%S.%f")
+                except ValueError:
+                    request_time = datetime.datetime.strptime(request_time_str, "%Y-%m-%d %H:%M:%S")
+            except (ValueError, IndexError):
+                continue
+            processed.append((timestamp, status, employee_id, request_type, priority, details, request_time))
+    return processed
+
+
+def make_processed_log(path, n, seed=42):
+    """Write n log lines, alternating the legacy and current formats"""
+    rng = random.Random(seed)
+    base = datetime.datetime(2025, 1, 1)
+    with open(path, "w") as f:
+        for i in range(n):
+            created = base + datetime.timedelta(seconds=rng.randrange(10 ** 7), microseconds=rng.randrange(10 ** 6))
+            processed = created + datetime.timedelta(days=rng.randrange(1, 10))
+            status = rng.choice(["APPROVED", "REJECTED"])
+            emp_id, req_type, priority = 10001 + rng.randrange(20), rng.choice(REQUEST_TYPES), rng.randint(1, 5)
+            if i % 2:
+                f.write(f"{processed}: {status}: Request [ID: {emp_id}, Type: {req_type}, Priority: {priority}, "
+                        f"Status: {status}, Details: Benchmark request {i}, Time: {created:%Y-%m-%d %H:%M:%S}]\n")
+            else:
+                f.write(f"{processed}: {status}: Employee ID: {emp_id}, Type: {req_type}, Priority: {priority}, "
+                        f"Details: Benchmark request {i}, Status: {status}, Timestamp: {created}\n")
+
+
+def bench_logparse(n_lines):
+    path = os.path.join(tempfile.mkdtemp(prefix="ems-bench-"), "processed_requests.log")
+    make_processed_log(path, n_lines)
+    legacy_time, legacy = _timed(legacy_parse_log, path)
+    new_time, new = _timed(lambda: list(part2.read_processed_log(path)))
+    print(f"{n_lines} log lines ({os.path.getsize(path) / 1e6:.0f} MB, half in each format)")
+    print(f"  find/strptime parser : {legacy_time:8.3f} s  ({len(legacy)} records understood)")
+    print(f"  regex parser         : {new_time:8.3f} s  ({len(new)} records understood)")
+
+
+# ---------------------------------------------------------------- report
+def legacy_dashboard_stats(records):
+    """The old report aggregation: decrypt stored records into a pandas DataFrame"""
+    import pandas as pd
+    from collections import Counter
+
+    rows = []
+    for e in records:
+        if e.get("is_admin", False):
+            continue
+        programmes = [part2.simple_decrypt(p[4:]) if p.startswith("enc:") else p for p in e.get("programmes", [])]
+        rows.append({"name": part2.simple_decrypt(e["name"][4:]), "is_full_time": bool(e.get("is_full_time")),
+                     "programmes": programmes, "department": e.get("department", "")})
+    df = pd.DataFrame(rows)
+    full_time = int(df["is_full_time"].sum())
+    programme_counts = Counter(p for sublist in df["programmes"] for p in sublist)
+    return {"total_employees": len(df), "full_time": full_time, "part_time": len(df) - full_time,
+            "departments": len(set(df["department"])),
+            "top_programmes": programme_counts.most_common()}
+
+
+def _peak_bytes(func, *args):
+    """Peak traced allocation while func runs, stdout silenced"""
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_report(n):
+    employees = make_employees(n)
+    records = [e.to_encrypted_dict() for e in employees]
+    system = make_system(employees)
+    report_path = os.path.abspath("dashboard_report.pdf")
+
+    cases = [("pandas DataFrame (old)", legacy_dashboard_stats, records),
+             ("columnar, lists", lambda: EmployeeStore.from_employees(employees).dashboard_counts(use_numpy=False)),
+             ("columnar, NumPy", lambda: EmployeeStore.from_employees(employees).dashboard_counts(use_numpy=True)),
+             ("maintained metrics read", system._dashboard_metrics),
+             ("full PDF report", system._generate_dashboard_pdf, report_path)]
+    print(f"{n} employees: dashboard aggregation and report generation (peak is this process only)")
+    for label, func, *args in cases:
+        try:
+            seconds, result = _timed(func, *args)
+        except ImportError as e:
+            print(f"  {label:<24}: skipped ({e.name} not installed)")
+            continue
+        if result is False:
+            print(f"  {label:<24}: failed (are matplotlib and reportlab installed?)")
+            continue
+        print(f"  {label:<24}: {seconds:8.3f} s  peak {_peak_bytes(func, *args) / 1e6:8.1f} MB")
+
+
+def _parse_sizes(text):
+    return [int(s) for s in text.split(",") if s.strip()]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    queue_parser = sub.add_parser("queue", help="list-based vs heap-based PriorityQueue")
+    queue_parser.add_argument("--sizes", type=_parse_sizes, default=[1000, 10000, 100000])
+    queue_parser.add_argument("--legacy-limit", type=int, default=20000,
+                              help="skip the quadratic list queue above this size")
+
+    lookup_parser = sub.add_parser("lookup", help="linear employee search vs ID index")
+    lookup_parser.add_argument("--employees", type=int, default=100000)
+
+    codec_parser = sub.add_parser("codec", help="employees.json load/save cycle, old vs new cipher")
+    codec_parser.add_argument("--source", default=os.path.abspath("employees.json"))
+    codec_parser.add_argument("--repeat", type=int, default=5000)
+
+    memory_parser = sub.add_parser("memory", help="bytes per employee for each representation")
+    memory_parser.add_argument("--employees", type=int, default=100000)
+
+    tree_parser = sub.add_parser("tree", help="department tree build and traversal")
+    tree_parser.add_argument("--employees", type=int, default=500000)
+    tree_parser.add_argument("--departments", type=int, default=10000)
+
+    sort_parser = sub.add_parser("sort", help="department/name sort: legacy vs key-based")
+    sort_parser.add_argument("--sizes", type=_parse_sizes, default=[10000, 100000, 1000000])
+    sort_parser.add_argument("--legacy-limit", type=int, default=100000,
+                             help="skip the recursive list-building sort above this size")
+
+    logparse_parser = sub.add_parser("logparse", help="processed_requests.log parsing, old vs new")
+    logparse_parser.add_argument("--lines", type=int, default=1000000)
+
+    report_parser = sub.add_parser("report", help="dashboard aggregation: pandas vs columnar, and the PDF")
+    report_parser.add_argument("--employees", type=int, default=100000)
+
+    args = parser.parse_args()
+    if args.bench == "queue":
+        bench_queue(args.sizes, args.legacy_limit)
+    elif args.bench == "lookup":
+        bench_lookup(args.employees)
+    elif args.bench == "codec":
+        bench_codec(args.source, args.repeat)
+    elif args.bench == "memory":
+        bench_memory(args.employees)
+    elif args.bench == "tree":
+        bench_tree(args.employees, args.departments)
+    elif args.bench == "sort":
+        bench_sort(args.sizes, args.legacy_limit)
+    elif args.bench == "logparse":
+        bench_logparse(args.lines)
+    elif args.bench == "report":
+        bench_report(args.employees)
@@ -1,53 +1,384 @@
+import builtins
+import sys
+import threading
+import time
+
+
+class ImportProfiler:
+    """Self and cumulative time of each import, in the layout of python -X importtime.
+
+    install() wraps builtins.__import__ so every absolute import of a module
+    not yet loaded is timed; measure() times one explicit load (LazyModule
+    uses it). Nesting is tracked per thread, so a background warm-up does not
+    mix its imports into the main thread's.
+    """
+
+    def __init__(self):
+        self.rows = []  # (module, self seconds, cumulative seconds, depth), in completion order
+        self._local = threading.local()
+        self._original_import = None
+
+    def install(self):
+        if self._original_import is None:
+            self._original_import = builtins.__import__
+            builtins.__import__ = self._import
+
+    def uninstall(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import
+        if level or name in sys.modules:
+            return original(name, globals, locals, fromlist, level)
+        return self.measure(name, lambda: original(name, globals, locals, fromlist, level))
+
+    def measure(self, name, load):
+        stack = self._local.__dict__.setdefault("stack", [])
+        stack.append(0.0)  # Time spent in nested imports
+        start = time.perf_counter()
+        try:
+            return load()
+        finally:
+            cumulative = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += cumulative
+            self.rows.append((name, cumulative - nested, cumulative, len(stack)))
+
+
+# Installed ahead of the remaining imports so --import-profile times startup as well.
+# Only for the script itself: importing part2 as a module leaves __import__ alone.
+_import_profiler = ImportProfiler()
+if __name__ == "__main__" and "--import-profile" in sys.argv:
+    _import_profiler.install()
+
 import re
 import base64
-from collections import defaultdict
+from collections import defaultdict, deque
 from email.mime.text import MIMEText
-from colorama import Fore, Style
+import importlib
 import itertools
-import sys
-import time
+import heapq
 import os
 import json
 import datetime
 import random
+import bisect
+import atexit
+import mmap
+import struct
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 SCOPES = ['https://www.googleapis.com/auth/gmail.send']
 
-def loading_animation(message="Loading"):
-    """Show a loading animation with a custom message"""
-    spinner = itertools.cycle(['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏'])
-    for i in range(3):  # Run for 3 full cycles
-        for _ in range(10):  # Each cycle has 10 spinner frames
-            char = next(spinner)
-            sys.stdout.write(f'\r{message} {char}')
+_import_lock = threading.Lock()
+
+
+class LazyModule:
+    """Stand-in for a module (or one of its attributes) that is imported on first use"""
+
+    def __init__(self, name, attribute=None):
+        self._name = name
+        self._attribute = attribute
+        self._target = None
+
+    def _load(self):
+        if self._target is None:
+            # Serialised so a background warm-up and the main thread never import the same module twice
+            with _import_lock:
+                if self._target is None:
+                    module = _import_profiler.measure(self._name, lambda: importlib.import_module(self._name))
+                    self._target = getattr(module, self._attribute) if self._attribute else module
+        return self._target
+
+    def __getattr__(self, attribute):
+        return getattr(self._load(), attribute)
+
+    def __repr__(self):
+        state = "loaded" if self._target is not None else "not loaded"
+        return f"<lazy {self._name}{'.' + self._attribute if self._attribute else ''} ({state})>"
+
+
+# Terminal colours are needed from the first prompt, but nothing else pays for them up front
+Fore = LazyModule("colorama", "Fore")
+Style = LazyModule("colorama", "Style")
+
+# Reporting and email dependencies, imported when a report or email first needs them
+_reportlab_pagesizes = LazyModule("reportlab.lib.pagesizes")
+_reportlab_platypus = LazyModule("reportlab.platypus")
+_reportlab_styles = LazyModule("reportlab.lib.styles")
+_google_credentials = LazyModule("google.oauth2.credentials")
+_google_oauth_flow = LazyModule("google_auth_oauthlib.flow")
+_google_discovery = LazyModule("googleapiclient.discovery")
+_google_transport = LazyModule("google.auth.transport.requests")
+
+_WARM_UP_MODULES = (_reportlab_pagesizes, _reportlab_platypus, _reportlab_styles,
+                    _google_credentials, _google_oauth_flow, _google_discovery, _google_transport)
+
+
+def warm_up_imports():
+    """Import the reporting and email dependencies in the background.
+
+    Chart workers import matplotlib in their own processes; the pool is
+    started here, before the warm-up thread, so they fork without it. Where
+    worker processes are unavailable only the thread warm-up runs, and the
+    dashboard renders in-process as before. Returns the warm-up thread.
+    Missing optional packages are skipped.
+    """
+    try:
+        pool = _dashboard_chart_pool()
+        for _ in range(_CHART_WORKERS):
+            pool.submit(_warm_chart_worker)
+    except (OSError, NotImplementedError, BrokenProcessPool):
+        _reset_dashboard_chart_pool()
+
+    def warm():
+        for module in _WARM_UP_MODULES:
+            try:
+                module._load()
+            except ImportError:
+                pass
+
+    thread = threading.Thread(target=warm, daemon=True)
+    thread.start()
+    return thread
+
+
+def import_profile():
+    """(module, self seconds, cumulative seconds, depth) rows, in the order imports finished.
+
+    Lazy imports are always recorded; startup imports only when the program was
+    started with --import-profile.
+    """
+    return list(_import_profiler.rows)
+
+
+def print_import_profile(file=None):
+    """Print the import times in the layout of python -X importtime"""
+    file = file or sys.stderr
+    print("import time: self [us] | cumulative | imported package", file=file)
+    for name, own, cumulative, depth in import_profile():
+        print(f"import time: {int(own * 1e6):>9} | {int(cumulative * 1e6):>10} | {'  ' * depth}{name}",
+              file=file)
+
+
+class ProgressIndicator:
+    """Spinner drawn by a background thread for as long as the wrapped work runs.
+
+    Use as a context manager and call stage() as the work moves on. Nothing
+    waits on the spinner, so quick work finishes without any delay.
+    """
+
+    frames = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
+
+    def __init__(self, message="Loading", interval=0.1):
+        self.message = message
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._thread = None
+        self._width = 0  # Widest line drawn so far, for clearing
+
+    def start(self):
+        self._done.clear()
+        self._thread = threading.Thread(target=self._spin, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._done.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            self._clear()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def stage(self, message):
+        with self._lock:
+            self.message = message
+
+    def print(self, text):
+        """Print a line without it being overwritten by the spinner"""
+        with self._lock:
+            self._clear()
+            print(text)
+
+    def _clear(self):
+        if self._width:
+            sys.stdout.write('\r' + ' ' * self._width + '\r')
             sys.stdout.flush()
-            time.sleep(0.1)
-    sys.stdout.write('\r' + ' ' * (len(message) + 4) + '\r')  # Clear the line
+            self._width = 0
+
+    def _spin(self):
+        for char in itertools.cycle(self.frames):
+            with self._lock:
+                line = f'{self.message} {char}'
+                sys.stdout.write('\r' + line.ljust(self._width))
+                sys.stdout.flush()
+                self._width = max(self._width, len(line))
+            if self._done.wait(self.interval):
+                break
+
+
+def loading_animation(message="Loading", duration=3.0):
+    """Show a loading animation with a custom message for duration seconds, then clear it.
+
+    To show a spinner only for as long as some work runs, wrap the work in
+    a ProgressIndicator instead.
+    """
+    with ProgressIndicator(message):
+        time.sleep(duration)
+
+
+_CHART_WORKERS = 3  # One per dashboard chart
+_chart_pool = None
+
+
+def _dashboard_chart_pool():
+    """Worker processes for chart rendering, kept for later reports so they import matplotlib once"""
+    global _chart_pool
+    if _chart_pool is None:
+        _chart_pool = ProcessPoolExecutor(max_workers=_CHART_WORKERS)
+        atexit.register(_chart_pool.shutdown, cancel_futures=True)
+    return _chart_pool
+
+
+def _reset_dashboard_chart_pool():
+    """Drop a broken pool (e.g. a worker was killed) so the next report starts fresh workers"""
+    global _chart_pool
+    if _chart_pool is not None:
+        _chart_pool.shutdown(wait=False, cancel_futures=True)
+        _chart_pool = None
+
+
+def _warm_chart_worker():
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot  # noqa: F401
+
+
+def _render_dashboard_chart(chart, data):
+    """Render one dashboard chart to PNG bytes.
+
+    Runs in a worker process: pyplot keeps global state and is not safe to
+    drive from several threads at once.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from io import BytesIO
+    from matplotlib import rcParams
+
+    # Set font to handle special characters
+    rcParams['font.family'] = 'DejaVu Sans'
+    rcParams['font.sans-serif'] = ['DejaVu Sans']
+
+    if chart == "employment":
+        fig, ax = plt.subplots()
+        ax.bar(['Full-Time', 'Part-Time'], data, color=['#4CAF50', '#FFC107'])
+        ax.set_title("Employment Type Distribution")
+    elif chart == "requests":
+        labels, sizes = data
+        fig, ax = plt.subplots()
+        ax.pie(sizes, labels=labels, autopct='%1.1f%%', colors=plt.cm.tab20.colors[:len(labels)])
+        ax.set_title("Request Status")
+    else:  # "programmes"
+        fig, ax = plt.subplots(figsize=(8, 4))
+        ax.bar([p[0] for p in data], [p[1] for p in data], color=plt.cm.tab20.colors[:5])
+        ax.set_title("Top 5 Programmes")
+        ax.set_ylabel("Enrollments")
+        plt.xticks(rotation=45, ha='right')
+
+    image = BytesIO()
+    plt.tight_layout()
+    fig.savefig(image, format='png', dpi=100)
+    plt.close(fig)
+    return image.getvalue()
+
+
+class _ShiftTable(dict):
+    """str.translate table shifting code points by a fixed key, filled on first use"""
+
+    def __init__(self, key):
+        super().__init__((cp, cp + key) for cp in range(max(0, -key), 256))
+        self.key = key
+
+    def __missing__(self, cp):
+        # chr() semantics: out-of-range results raise ValueError in translate
+        self[cp] = shifted = cp + self.key
+        return shifted
+
+
+_SHIFT_TABLES = {}
+
+
+def _shift_table(shift):
+    table = _SHIFT_TABLES.get(shift)
+    if table is None:
+        table = _SHIFT_TABLES[shift] = _ShiftTable(shift)
+    return table
 
 
 def simple_encrypt(data, key=5):
     """Simple Caesar cipher encryption for sensitive fields"""
-    encrypted = ""
-    for char in str(data):
-        encrypted += chr(ord(char) + key)
-    return encrypted
+    return str(data).translate(_shift_table(key))
 
 
 def simple_decrypt(encrypted, key=5):
     """Simple Caesar cipher decryption"""
-    decrypted = ""
-    for char in encrypted:
-        decrypted += chr(ord(char) - key)
-    return decrypted
+    return encrypted.translate(_shift_table(-key))
+
+
+def _shift_many(values, shift):
+    """Shift a whole column of strings in one pass.
+
+    The column is joined, translated once and sliced back apart, which
+    avoids a translate call per value.
+    """
+    values = [str(v) for v in values]
+    joined = "".join(values).translate(_shift_table(shift))
+
+    result = []
+    pos = 0
+    for value in values:
+        result.append(joined[pos:pos + len(value)])
+        pos += len(value)
+    return result
+
+
+def simple_encrypt_many(values, key=5):
+    """simple_encrypt applied to every item of a column"""
+    return _shift_many(values, key)
+
+
+def simple_decrypt_many(values, key=5):
+    """simple_decrypt applied to every item of a column"""
+    return _shift_many(values, -key)
 
 
 class Employee:
+    __slots__ = ("employee_id", "department", "is_full_time", "programmes",
+                 "enrollment_history", "is_admin", "_name", "_email", "_salary", "_observer")
+
+    # Cap on enrollment history entries kept per employee (None = keep everything)
+    enrollment_history_limit = None
+
     def __init__(self, name, employee_id, email, department, is_full_time, salary="50000", programmes=None, is_admin=False):
         self.employee_id = employee_id
         self.department = department
         self.is_full_time = is_full_time
         self.programmes = programmes if programmes else []
-        self.enrollment_history = LinkedList()  # Changed from list to LinkedList
+        self.enrollment_history = LinkedList(self.enrollment_history_limit)  # Changed from list to LinkedList
         self.is_admin = is_admin
 
         # Store unencrypted data in memory
@@ -55,6 +386,9 @@ class Employee:
         self._email = email
         self._salary = salary
 
+        # Callback notified when the employee changes (set by EmployeeManagementSystem)
+        self._observer = None
+
     @property
     def name(self):
         return self._name
@@ -83,6 +417,8 @@ class Employee:
         self.programmes.append(programme_name)
         timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self.enrollment_history.append(f"{timestamp}: Enrolled in {programme_name}")
+        if self._observer:
+            self._observer(self)
 
     def to_encrypted_dict(self):
         """Convert to dictionary with encrypted sensitive fields for storage"""
@@ -93,58 +429,458 @@ class Employee:
             "department": self.department,
             "is_full_time": self.is_full_time,
             "salary": f"enc:{simple_encrypt(self._salary)}",
-            "programmes": [f"enc:{simple_encrypt(p)}" for p in self.programmes],
+            "programmes": [f"enc:{p}" for p in simple_encrypt_many(self.programmes)],
             "enrollment_history": self._serialize_enrollment_history(),
             "is_admin": self.is_admin
         }
 
     def _serialize_enrollment_history(self):
         """Convert linked list to serializable list"""
-        history = []
-        current = self.enrollment_history.head
-        while current:
-            history.append(current.data)
-            current = current.next
-        return history
+        return list(self.enrollment_history)
 
 
 class Node:
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
 
 
 class LinkedList:
-    def __init__(self):
+    __slots__ = ("head", "tail", "length", "max_length")
+
+    def __init__(self, max_length=None):
         self.head = None
+        self.tail = None
+        self.length = 0
+        self.max_length = max_length  # Oldest entries are dropped beyond this
 
     def append(self, data):
+        node = Node(data)
         if not self.head:
-            self.head = Node(data)
+            self.head = node
         else:
-            current = self.head
-            while current.next:
-                current = current.next
-            current.next = Node(data)
-
-    def display(self):
+            self.tail.next = node
+        self.tail = node
+        self.length += 1
+        if self.max_length is not None and self.length > self.max_length:
+            self.head = self.head.next
+            self.length -= 1
+            if self.head is None:
+                self.tail = None
+
+    def extend(self, items):
+        for data in items:
+            self.append(data)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
         current = self.head
         while current:
-            print(current.data)
+            yield current.data
             current = current.next
 
+    def page(self, offset=0, limit=None):
+        """Entries [offset, offset + limit) without copying the whole list"""
+        stop = None if limit is None else offset + limit
+        return list(itertools.islice(self, offset, stop))
+
+    def display(self):
+        for data in self:
+            print(data)
+
+
+class EmployeeStore:
+    """Column-oriented, memory-compact copy of a set of employees.
+
+    Flags and IDs live in typed arrays, department and programme names are
+    interned into lookup tables, and each employee's programmes are a slice of
+    one shared array described by an offsets column. Sorting and filtering
+    methods work on row indices so no Employee objects are needed.
+    """
+
+    def __init__(self):
+        self.employee_ids = array('q')
+        self.is_full_time = array('b')
+        self.is_admin = array('b')
+        self.department_codes = array('H')
+        self.departments = []  # code -> department name
+        self._department_lookup = {}
+        self.programme_offsets = array('I', [0])  # row i owns programme_codes[off[i]:off[i + 1]]
+        self.programme_codes = array('H')
+        self.programmes = []  # code -> programme name
+        self._programme_lookup = {}
+        self.names = []
+        self.emails = []
+        self.salaries = []
+
+    @classmethod
+    def from_employees(cls, employees):
+        store = cls()
+        for emp in employees:
+            store.append(emp)
+        return store
+
+    def __len__(self):
+        return len(self.employee_ids)
+
+    def _intern(self, value, table, lookup):
+        code = lookup.get(value)
+        if code is None:
+            code = lookup[value] = len(table)
+            table.append(value)
+        return code
+
+    def append(self, employee):
+        self.employee_ids.append(employee.employee_id)
+        self.is_full_time.append(bool(employee.is_full_time))
+        self.is_admin.append(bool(employee.is_admin))
+        self.department_codes.append(
+            self._intern(employee.department, self.departments, self._department_lookup))
+        for programme in employee.programmes:
+            self.programme_codes.append(
+                self._intern(programme, self.programmes, self._programme_lookup))
+        self.programme_offsets.append(len(self.programme_codes))
+        self.names.append(sys.intern(employee.name))
+        self.emails.append(employee.email)
+        self.salaries.append(employee.salary)
+
+    def set_programmes(self, row, programmes):
+        """Replace one row's programmes; O(rows after it), as later slices shift"""
+        start, end = self.programme_offsets[row], self.programme_offsets[row + 1]
+        self.programme_codes[start:end] = array(self.programme_codes.typecode, (
+            self._intern(programme, self.programmes, self._programme_lookup) for programme in programmes))
+        shift = len(programmes) - (end - start)
+        if shift:
+            offsets = self.programme_offsets
+            offsets[row + 1:] = array(offsets.typecode, (offset + shift for offset in offsets[row + 1:]))
+
+    def department(self, row):
+        return self.departments[self.department_codes[row]]
+
+    def programme_count(self, row):
+        return self.programme_offsets[row + 1] - self.programme_offsets[row]
+
+    def programmes_of(self, row):
+        start, end = self.programme_offsets[row], self.programme_offsets[row + 1]
+        return [self.programmes[code] for code in self.programme_codes[start:end]]
+
+    def employee(self, row):
+        """Materialize a single row as an Employee"""
+        return Employee(self.names[row], self.employee_ids[row], self.emails[row],
+                        self.department(row), bool(self.is_full_time[row]), self.salaries[row],
+                        self.programmes_of(row), bool(self.is_admin[row]))
+
+    def rows(self, department=None, include_admins=False):
+        """Row indices, optionally limited to one department"""
+        code = self._department_lookup.get(department) if department is not None else None
+        if department is not None and code is None:
+            return []
+        return [row for row in range(len(self))
+                if (include_admins or not self.is_admin[row])
+                and (code is None or self.department_codes[row] == code)]
+
+    def order_by_department_name(self, rows=None):
+        """Rows sorted by department then name, both case-insensitive"""
+        rows = self.rows() if rows is None else rows
+        folded_departments = [d.casefold() for d in self.departments]
+        return sorted(rows, key=lambda r: (folded_departments[self.department_codes[r]],
+                                           self.names[r].casefold()))
+
+    def order_by_programmes(self, rows=None, descending=False):
+        """Rows sorted by programme count then employee ID"""
+        rows = self.rows() if rows is None else rows
+        sign = -1 if descending else 1
+        return sorted(rows, key=lambda r: (sign * self.programme_count(r), self.employee_ids[r]))
+
+    def dashboard_counts(self, rows=None, use_numpy=None):
+        """Dashboard figures (the same as DashboardMetrics.snapshot()) computed from the columns.
+
+        Tallies are made on the integer codes: plain lists for small stores,
+        NumPy bincount for large ones when it is installed. use_numpy forces
+        the choice either way; use_numpy=True raises ImportError when NumPy
+        is not installed rather than quietly using the lists.
+        """
+        rows = self.rows() if rows is None else rows
+        np = None
+        if use_numpy:
+            import numpy as np
+        elif use_numpy is None and len(rows) >= 50000:
+            try:
+                import numpy as np
+            except ImportError:
+                np = None
+
+        if np is not None:
+            selected = np.zeros(len(self), dtype=bool)
+            selected[np.asarray(rows, dtype=np.intp)] = True
+            offsets = np.frombuffer(self.programme_offsets, dtype=self.programme_offsets.typecode)
+            owners = np.repeat(np.arange(len(self)), np.diff(offsets))  # Row of each programme code
+            codes = np.frombuffer(self.programme_codes, dtype=self.programme_codes.typecode)
+            selected_codes = codes[selected[owners]]
+            code_counts = np.bincount(selected_codes, minlength=len(self.programmes)).tolist()
+            seen_codes, first_index = np.unique(selected_codes, return_index=True)
+            first_seen = [len(codes)] * len(self.programmes)
+            for code, index in zip(seen_codes.tolist(), first_index.tolist()):
+                first_seen[code] = index
+            full_time = int(np.frombuffer(self.is_full_time, dtype=self.is_full_time.typecode)[selected].sum())
+            department_codes = np.frombuffer(self.department_codes, dtype=self.department_codes.typecode)
+            departments = int(np.unique(department_codes[selected]).size)
+        else:
+            code_counts = [0] * len(self.programmes)
+            first_seen = [0] * len(self.programmes)
+            position = 0
+            for row in rows:
+                for code in self.programme_codes[self.programme_offsets[row]:self.programme_offsets[row + 1]]:
+                    if not code_counts[code]:
+                        first_seen[code] = position
+                    code_counts[code] += 1
+                    position += 1
+            full_time = sum(self.is_full_time[row] for row in rows)
+            departments = len({self.department_codes[row] for row in rows})
+
+        # Ties rank by first appearance among the rows, as Counter.most_common does
+        ranked = sorted((code for code, count in enumerate(code_counts)
+                         if count and isinstance(self.programmes[code], str) and self.programmes[code]),
+                        key=lambda code: (-code_counts[code], first_seen[code]))
+        programme_counts = {self.programmes[code]: code_counts[code] for code in ranked}
+        return {
+            "total_employees": len(rows),
+            "full_time": full_time,
+            "part_time": len(rows) - full_time,
+            "departments": departments,
+            "programme_counts": programme_counts,
+            "top_programmes": list(programme_counts.items()),
+        }
+
+
+class PageCursor:
+    """Offset-based cursor over a sequence, one page at a time"""
+
+    def __init__(self, rows, page_size=50):
+        self.rows = rows
+        self.page_size = max(1, page_size)
+        self.offset = 0
+
+    @property
+    def pages(self):
+        return max(1, -(-len(self.rows) // self.page_size))
+
+    @property
+    def page_number(self):
+        return self.offset // self.page_size + 1
+
+    def current(self):
+        return self.rows[self.offset:self.offset + self.page_size]
+
+    def next(self):
+        if self.offset + self.page_size < len(self.rows):
+            self.offset += self.page_size
+            return True
+        return False
+
+    def previous(self):
+        if self.offset > 0:
+            self.offset -= self.page_size
+            return True
+        return False
+
+    def goto(self, page_number):
+        if 1 <= page_number <= self.pages:
+            self.offset = (page_number - 1) * self.page_size
+            return True
+        return False
+
+
+def write_lines(lines):
+    """Emit a batch of formatted lines with a single buffered write"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+class SortedView:
+    """Employees kept in key order, maintained incrementally with bisect"""
+
+    def __init__(self, key):
+        self.key = key  # key(employee, seq) -> unique, comparable tuple
+        self._keys = []
+        self._items = []
+        self._filed = {}  # employee -> key it is currently filed under
+
+    def load_sorted(self, entries):
+        """Bulk build from (employee, seq) pairs that are already in key order"""
+        self._keys = [self.key(emp, seq) for emp, seq in entries]
+        self._items = [emp for emp, _ in entries]
+        self._filed = dict(zip(self._items, self._keys))
+
+    def load(self, entries, sorter=None):
+        """Bulk build from (employee, seq) pairs"""
+        decorated = [(self.key(emp, seq), i) for i, (emp, seq) in enumerate(entries)]
+        employees = [emp for emp, _ in entries]
+        if sorter:
+            decorated = sorter(decorated) or decorated
+        else:
+            decorated.sort()
+        self._keys = [key for key, _ in decorated]
+        self._items = [employees[i] for _, i in decorated]
+        self._filed = dict(zip(self._items, self._keys))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, employee):
+        return employee in self._filed
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def insert(self, employee, seq):
+        key = self.key(employee, seq)
+        pos = bisect.bisect_left(self._keys, key)
+        self._keys.insert(pos, key)
+        self._items.insert(pos, employee)
+        self._filed[employee] = key
+
+    def remove(self, employee):
+        key = self._filed.pop(employee)
+        pos = bisect.bisect_left(self._keys, key)
+        del self._keys[pos]
+        del self._items[pos]
+
+    def items(self):
+        return list(self._items)
+
+    def __getitem__(self, index):
+        # Slicing lets a PageCursor read one page without copying the view
+        return self._items[index]
+
+
+class DashboardMetrics:
+    """Employee figures for the dashboard, updated as employees are added or enrol.
+
+    Reads are O(1); top_programmes(k) is O(k) over a ranking kept sorted with
+    bisect. Ties rank by where a programme first appears in the employee list
+    (employee order, then position in their programmes), the order
+    Counter.most_common gives over self.employees, whatever order the
+    enrolments happened in.
+    """
+
+    def __init__(self, employees=()):
+        self.total_employees = 0
+        self.full_time = 0
+        self.department_counts = defaultdict(int)  # department -> non-admin employees
+        self.programme_counts = {}  # programme -> enrolments
+        self._first_seen = {}  # programme -> earliest (employee seq, index) it appears at
+        self._ranking = []  # (-count, first_seen, programme), most enrolments first
+        self._counted = {}  # employee -> [seq, how many of its programmes are counted]
+        for employee in employees:
+            self.add_employee(employee)
+
+    @property
+    def part_time(self):
+        return self.total_employees - self.full_time
+
+    @property
+    def departments(self):
+        return len(self.department_counts)
+
+    def add_employee(self, employee):
+        if employee.is_admin:
+            return
+        self.total_employees += 1
+        self.full_time += bool(employee.is_full_time)
+        self.department_counts[employee.department] += 1
+        self._counted[employee] = [len(self._counted), 0]
+        self.employee_changed(employee)
+
+    def employee_changed(self, employee):
+        """Count programmes appended since the employee was last seen"""
+        state = self._counted.get(employee)
+        if state is None:
+            return
+        seq, counted = state
+        for index in range(counted, len(employee.programmes)):
+            programme = employee.programmes[index]
+            if isinstance(programme, str) and programme:
+                self._enrol(programme, (seq, index))
+        state[1] = len(employee.programmes)
+
+    def _enrol(self, programme, position):
+        count = self.programme_counts.get(programme, 0)
+        seen = self._first_seen.get(programme)
+        if count:
+            del self._ranking[bisect.bisect_left(self._ranking, (-count, seen, programme))]
+        if seen is None or position < seen:
+            # An enrolment of an earlier employee moves the programme's tie-break forward
+            seen = self._first_seen[programme] = position
+        self.programme_counts[programme] = count + 1
+        bisect.insort(self._ranking, (-count - 1, seen, programme))
+
+    def top_programmes(self, k=1):
+        """The k most enrolled programmes as (programme, count) pairs"""
+        return [(programme, -count) for count, _, programme in self._ranking[:k]]
+
+    def snapshot(self):
+        return {
+            "total_employees": self.total_employees,
+            "full_time": self.full_time,
+            "part_time": self.part_time,
+            "departments": self.departments,
+            "programme_counts": dict(self.programme_counts),
+            "top_programmes": self.top_programmes(len(self._ranking)),
+        }
+
+    def check(self, employees):
+        """Names of figures that differ from a full columnar recompute over employees"""
+        expected = EmployeeStore.from_employees(employees).dashboard_counts()
+        actual = self.snapshot()
+        return [name for name in expected if expected[name] != actual[name]]
+
 
 # Tree structure for Employee Training Management System
 class DepartmentNode:
-    def __init__(self, name):
+    def __init__(self, name, parent=None):
         self.name = name
+        self.parent = parent
         self.employees = []
         self.children = []
+        # Counts for this node's own employees, kept current on every insert/removal
+        self.own_admin_count = 0
+        self.own_full_time_count = 0
+        # Rolled-up counts for this node and everything below it, refreshed by EmployeeTree
+        self.total_count = 0
+        self.admin_count = 0
+        self.full_time_count = 0
+
+    @property
+    def staff_count(self):
+        return self.total_count - self.admin_count
+
+    def _adjust_counts(self, employee, delta):
+        """Apply an insert (+1) or removal (-1) to this node's own counts"""
+        if employee.is_admin:
+            self.own_admin_count += delta
+        if employee.is_full_time:
+            self.own_full_time_count += delta
+
+    def path(self):
+        """Department names from the root down to this node"""
+        names = []
+        node = self
+        while node:
+            names.append(node.name)
+            node = node.parent
+        return names[::-1]
 
 
 class EmployeeTree:
     def __init__(self):
         self.root = DepartmentNode("Organization")
+        self._nodes = {self.root.name: self.root}  # Department name -> DepartmentNode
+        self._rollups_stale = False  # Set by inserts/removals, cleared by _refresh_rollups
         self._initialize_admin()
 
     def _initialize_admin(self):
@@ -158,92 +894,650 @@ class EmployeeTree:
             salary="100000",
             is_admin=True
         )
-        self.root.employees.append(admin)
+        self._attach(self.root, admin)
+
+    def _attach(self, department, employee):
+        department.employees.append(employee)
+        department._adjust_counts(employee, 1)
+        self._rollups_stale = True
+
+    def _refresh_rollups(self):
+        """Recompute every node's rolled-up counts in one post-order pass, if anything changed"""
+        if not self._rollups_stale:
+            return
+        # Reversed pre-order visits every child before its parent
+        for node, _ in reversed(list(self._walk())):
+            node.total_count = len(node.employees)
+            node.admin_count = node.own_admin_count
+            node.full_time_count = node.own_full_time_count
+            for child in node.children:
+                node.total_count += child.total_count
+                node.admin_count += child.admin_count
+                node.full_time_count += child.full_time_count
+        self._rollups_stale = False
 
     def add_department(self, department_name, parent_name="Organization"):
-        parent = self._find_node(parent_name)
+        parent = self._nodes.get(parent_name)
         if parent:
-            # Check if department already exists
-            if not any(child.name == department_name for child in parent.children):
-                parent.children.append(DepartmentNode(department_name))
+            # Department names are unique keys in the index
+            if department_name not in self._nodes:
+                node = DepartmentNode(department_name, parent)
+                parent.children.append(node)
+                self._nodes[department_name] = node
                 return True
         return False
 
     def add_employee(self, employee, department_name):
-        department = self._find_node(department_name)
+        department = self._nodes.get(department_name)
         if department:
             # Ensure only one admin exists (at Organization level)
             if employee.is_admin:
                 if department_name != "Organization":
                     return False
                 # Replace existing admin if adding new one
-                if any(emp.is_admin for emp in self.root.employees):
-                    self.root.employees = [emp for emp in self.root.employees if not emp.is_admin]
+                for emp in [emp for emp in self.root.employees if emp.is_admin]:
+                    self.remove_employee(emp, "Organization")
 
-            department.employees.append(employee)
+            self._attach(department, employee)
             return True
         return False
 
-    def _find_node(self, name, node=None):
-        if node is None:
-            node = self.root
-
-        if node.name == name:
-            return node
-
-        for child in node.children:
-            found = self._find_node(name, child)
-            if found:
-                return found
-
-        return None
+    def remove_employee(self, employee, department_name):
+        department = self._nodes.get(department_name)
+        if department and employee in department.employees:
+            department.employees.remove(employee)
+            department._adjust_counts(employee, -1)
+            self._rollups_stale = True
+            return True
+        return False
 
-    def display_tree(self, node=None, level=0, show_admins=False, recursive_counts=False):
+    def rollup(self, department_name="Organization"):
+        """Aggregate counts for a department including all sub-departments"""
+        node = self._nodes.get(department_name)
         if node is None:
-            node = self.root
+            return None
+        self._refresh_rollups()
+        return {
+            "total": node.total_count,
+            "admins": node.admin_count,
+            "staff": node.staff_count,
+            "full_time": node.full_time_count,
+            "part_time": node.total_count - node.full_time_count,
+        }
 
-        # Count employees (with optional recursive counting)
-        if recursive_counts:
-            all_employees = self.get_all_employees(node)
-        else:
-            all_employees = node.employees
+    def _find_node(self, name, node=None):
+        found = self._nodes.get(name)
+        if found is None or node is None:
+            return found
+        # Restrict the match to the subtree under node
+        current = found
+        while current is not None and current is not node:
+            current = current.parent
+        return found if current is node else None
+
+    def _walk(self, node=None, breadth_first=False):
+        """Iterative traversal yielding (node, level), pre-order or level by level"""
+        if breadth_first:
+            queue = deque([(node or self.root, 0)])
+            while queue:
+                current, level = queue.popleft()
+                yield current, level
+                queue.extend((child, level + 1) for child in current.children)
+            return
 
-        total_count = len(all_employees)
-        admin_count = sum(1 for emp in all_employees if emp.is_admin)
-        non_admin_count = total_count - admin_count
+        stack = [(node or self.root, 0)]
+        while stack:
+            current, level = stack.pop()
+            yield current, level
+            for child in reversed(current.children):
+                stack.append((child, level + 1))
+
+    def iter_employees(self, node=None, breadth_first=False, department=None, predicate=None):
+        """Lazily yield employees under node (or under the named department).
+
+        Nothing is copied, so callers can stop early (e.g. with itertools.islice
+        or next()) and memory stays flat regardless of organization size.
+        """
+        if department is not None:
+            node = self._find_node(department, node)
+            if node is None:
+                return
+        for current, _ in self._walk(node, breadth_first):
+            for emp in current.employees:
+                if predicate is None or predicate(emp):
+                    yield emp
 
-        # Hardcode the organization total to 21
-        if node.name == "Organization":
-            total_count = 21
-            # Calculate non-admin count based on actual admin count
+    def display_tree(self, node=None, level=0, show_admins=False, recursive_counts=False):
+        self._refresh_rollups()
+        for node, depth in self._walk(node):
+            indent = "  " * (level + depth)
+
+            # Count employees (with optional recursive counting);
+            # the Organization line always shows the live organization total
+            if recursive_counts or node is self.root:
+                total_count = node.total_count
+                admin_count = node.admin_count
+            else:
+                total_count = len(node.employees)
+                admin_count = node.own_admin_count
             non_admin_count = total_count - admin_count
 
-        # Print department info
-        print("  " * level + node.name +
-              f" (Total: {total_count} | " +
-              f"Admins: {admin_count} | " +
-              f"Staff: {non_admin_count})")
-
-        # Optionally display employees
-        for emp in node.employees:
-            if show_admins or not emp.is_admin:
-                print("  " * (level + 1) + f"- {emp.name} (ID: {emp.employee_id})")
+            # Print department info
+            print(indent + node.name +
+                  f" (Total: {total_count} | " +
+                  f"Admins: {admin_count} | " +
+                  f"Staff: {non_admin_count})")
 
-        # Recurse into sub-departments
-        for child in node.children:
-            self.display_tree(child, level + 1, show_admins, recursive_counts)
+            # Optionally display employees
+            for emp in node.employees:
+                if show_admins or not emp.is_admin:
+                    print(indent + "  " + f"- {emp.name} (ID: {emp.employee_id})")
 
     def get_all_employees(self, node=None):
         """Get all employees from all departments"""
-        if node is None:
-            node = self.root
+        return list(self.iter_employees(node))
+
+    def check_rollups(self):
+        """Departments whose rolled-up counts differ from a streamed recount of their subtree"""
+        self._refresh_rollups()
+        mismatched = []
+        for node, _ in self._walk():
+            total = admins = full_time = 0
+            for emp in self.iter_employees(node):
+                total += 1
+                admins += bool(emp.is_admin)
+                full_time += bool(emp.is_full_time)
+            if (total, admins, full_time) != (node.total_count, node.admin_count, node.full_time_count):
+                mismatched.append(node.name)
+        return mismatched
+
+
+# Processed-request log parsing. Two line formats exist in the wild:
+#   legacy: "<ts>: APPROVED: Request [ID: 1, Type: t, Priority: 1, Status: s, Details: d, Time: <ts>]"
+#   current (_log_request): "<ts>: APPROVED: Employee ID: 1, Type: t, Priority: 1, Details: d, Status: s, Timestamp: <ts>"
+_PROCESSED_LOG_LINE = re.compile(
+    r"^(?P<processed>\d{4}-\d\d-\d\d \d\d:\d\d:\d\d(?:\.\d+)?): "
+    r"(?P<status>APPROVED|REJECTED): (?P<raw>(?:Request \[|Employee )ID: (?P<employee_id>\d+), "
+    r"Type: (?P<request_type>.*?), Priority: (?P<priority>-?\d+), "
+    r"(?:Status: .*?, Details: (?P<legacy_details>.*), Time: (?P<legacy_time>[^\]]*)\]"
+    r"|Details: (?P<details>.*), Status: .*?, Timestamp: (?P<time>.*)))$"
+)
+
+
+def _parse_log_timestamp(text):
+    try:
+        return datetime.datetime.fromisoformat(text)
+    except ValueError:
+        pass
+    for fmt in ("%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S"):
+        try:
+            return datetime.datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
 
-        employees = node.employees.copy()
 
-        for child in node.children:
-            employees.extend(self.get_all_employees(child))
+def parse_processed_log_line(line):
+    """Parse one processed_requests.log line into a dict, or None if it is not a record"""
+    match = _PROCESSED_LOG_LINE.match(line.strip())
+    if not match:
+        return None
 
-        return employees
+    processed_time = _parse_log_timestamp(match["processed"])
+    if match["legacy_time"] is not None:
+        details, request_time = match["legacy_details"], match["legacy_time"]
+    else:
+        details, request_time = match["details"], match["time"]
+    request_time = _parse_log_timestamp(request_time.strip())
+    if processed_time is None or request_time is None:
+        return None
+
+    return {
+        'processed_time': processed_time,
+        'status': match["status"],
+        'employee_id': int(match["employee_id"]),
+        'request_type': match["request_type"].strip(),
+        'priority': int(match["priority"]),
+        'details': details.strip(),
+        'original_request_time': request_time,
+        'raw_data': match["raw"]
+    }
+
+
+def read_processed_log(path):
+    """Yield parsed records from a processed-request log, skipping unparseable lines"""
+    with open(path, 'r') as f:
+        for line in f:
+            record = parse_processed_log_line(line)
+            if record is not None:
+                yield record
+
+
+class RequestLogWriter:
+    """Long-lived, buffered appender for the processed-request log.
+
+    Lines are held in memory and written in one go once max_records lines or
+    max_bytes bytes are pending. A background timer flushes anything still
+    pending flush_interval seconds after it was buffered, so a line never waits
+    longer than that. With fsync=True each flush is also a group commit to
+    disk. Pending lines are flushed at interpreter exit.
+    """
+
+    def __init__(self, path, max_records=50, max_bytes=64 * 1024, flush_interval=2.0, fsync=False,
+                 binary=False, on_flush=None):
+        self.path = path
+        self.binary = binary  # Buffer bytes and append in 'ab' mode
+        self.on_flush = on_flush  # Called with the file size after each flush
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self._buffer = []
+        self._buffered_bytes = 0
+        self._last_flush = time.monotonic()
+        self._file = None
+        self._timer = None  # Pending interval flush, if any
+        self.lock = threading.RLock()  # Held by writes and by the timer's flush
+        self._at_exit = False  # Whether close() is registered to run at interpreter exit
+
+    def write(self, line):
+        with self.lock:
+            if not self._at_exit:
+                # Registered while there is something to flush, so closed writers do not pile up
+                atexit.register(self.close)
+                self._at_exit = True
+            self._buffer.append(line)
+            self._buffered_bytes += len(line)
+            if (len(self._buffer) >= self.max_records
+                    or self._buffered_bytes >= self.max_bytes
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self._interval_flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _interval_flush(self):
+        with self.lock:
+            self._timer = None
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            self._flush()
+
+    def _flush(self):
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        if self._file is None:
+            self._file = open(self.path, 'ab' if self.binary else 'a')
+        self._file.write((b"" if self.binary else "").join(self._buffer))
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._buffer.clear()
+        self._buffered_bytes = 0
+        if self.on_flush:
+            self.on_flush(self._file.tell())
+
+    def close(self):
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._flush()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if self._at_exit:
+                atexit.unregister(self.close)
+                self._at_exit = False
+
+
+def _empty_segment_summary():
+    return {"first": None, "last": None, "bytes": 0, "total": 0, "approved": 0, "rejected": 0,
+            "by_type": {}, "by_priority": {}}
+
+
+def _add_to_segment_summary(summary, record):
+    processed = record['processed_time'].isoformat(sep=' ')
+    if summary["first"] is None or processed < summary["first"]:
+        summary["first"] = processed
+    if summary["last"] is None or processed > summary["last"]:
+        summary["last"] = processed
+    outcome = 'approved' if record['status'].upper().startswith('APPROVED') else 'rejected'
+    summary["total"] += 1
+    summary[outcome] += 1
+    for group, key in (("by_type", record['request_type']), ("by_priority", str(record['priority']))):
+        counts = summary[group].setdefault(key, {'approved': 0, 'rejected': 0})
+        counts[outcome] += 1
+
+
+class SegmentedRequestLog:
+    """Processed-request log rotated into daily or monthly segment files.
+
+    Each segment "<period>.log" has a "<period>.log.summary" JSON sidecar with
+    its counts by type, priority and status and its first/last processed
+    times. Date-ranged reads open only the segments whose range overlaps, and
+    counts over whole segments come straight from the summaries. A summary
+    that no longer matches its segment's size is rebuilt from the segment.
+    """
+
+    def __init__(self, directory, period="monthly"):
+        self.directory = directory
+        self.period = period
+        self._writer = None
+        self._segment = None  # Period key of the open segment
+        self._summary = None  # Summary of the open segment, including buffered lines
+
+    def segment_key(self, when):
+        return when.strftime("%Y-%m-%d" if self.period == "daily" else "%Y-%m")
+
+    def _segment_path(self, key):
+        return os.path.join(self.directory, f"{key}.log")
+
+    def append(self, line, record):
+        key = self.segment_key(record['processed_time'])
+        if key != self._segment:
+            self.close()
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._segment_path(key)
+            self._segment = key
+            self._summary = self._load_summary(path)
+            self._writer = RequestLogWriter(path, on_flush=self._write_summary)
+        # Count the record before writing it: the write may flush and save the summary
+        with self._writer.lock:
+            _add_to_segment_summary(self._summary, record)
+            self._writer.write(line)
+
+    def _write_summary(self, size):
+        self._summary["bytes"] = size
+        path = self._segment_path(self._segment) + ".summary"
+        with open(path + ".tmp", 'w') as f:
+            json.dump(self._summary, f)
+        os.replace(path + ".tmp", path)
+
+    def _load_summary(self, path):
+        """The segment's summary, rebuilt by parsing the segment if it is stale or missing"""
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        try:
+            with open(path + ".summary", 'r') as f:
+                summary = json.load(f)
+            if summary["bytes"] == size:
+                return summary
+        except (OSError, ValueError, KeyError):
+            pass
+
+        summary = _empty_segment_summary()
+        if size:
+            for record in read_processed_log(path):
+                _add_to_segment_summary(summary, record)
+        summary["bytes"] = size
+        return summary
+
+    def flush(self):
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._write_summary(os.path.getsize(self._writer.path))
+        self._writer = self._segment = self._summary = None
+
+    def segments(self, start=None, end=None):
+        """(path, summary) for segments overlapping [start, end], oldest first"""
+        self.flush()
+        if not os.path.isdir(self.directory):
+            return []
+        start = start.isoformat(sep=' ') if start else None
+        end = end.isoformat(sep=' ') if end else None
+        selected = []
+        for name in sorted(os.listdir(self.directory)):
+            if not name.endswith(".log"):
+                continue
+            path = os.path.join(self.directory, name)
+            summary = self._load_summary(path)
+            if summary["total"] == 0:
+                continue
+            if (start and summary["last"] < start) or (end and summary["first"] > end):
+                continue  # Pruned: the whole segment is outside the range
+            selected.append((path, summary))
+        return selected
+
+    def _covers(self, summary, start, end):
+        return ((not start or summary["first"] >= start.isoformat(sep=' '))
+                and (not end or summary["last"] <= end.isoformat(sep=' ')))
+
+    def lines(self, start=None, end=None):
+        """Raw log lines processed within [start, end]"""
+        for path, summary in self.segments(start, end):
+            whole = self._covers(summary, start, end)
+            with open(path, 'r') as f:
+                for line in f:
+                    if whole:
+                        yield line
+                        continue
+                    record = parse_processed_log_line(line)
+                    if record and _in_range(record['processed_time'], start, end):
+                        yield line
+
+    def records(self, start=None, end=None):
+        """Parsed records processed within [start, end]"""
+        for path, _ in self.segments(start, end):
+            for record in read_processed_log(path):
+                if _in_range(record['processed_time'], start, end):
+                    yield record
+
+    def count(self, start=None, end=None):
+        """Number of records in range; segments fully inside it are counted from summaries"""
+        total = 0
+        for path, summary in self.segments(start, end):
+            if self._covers(summary, start, end):
+                total += summary["total"]
+            else:
+                total += sum(1 for record in read_processed_log(path)
+                             if _in_range(record['processed_time'], start, end))
+        return total
+
+    def import_text_log(self, path):
+        """Move the records of an unsegmented text log into segments.
+
+        Once every record is written, the source is renamed to
+        "<path>.imported" so it is not read alongside the segments again.
+        """
+        with open(path, 'r') as f:
+            for line in f:
+                record = parse_processed_log_line(line)
+                if record is not None:
+                    self.append(line if line.endswith("\n") else line + "\n", record)
+        self.close()
+        os.replace(path, path + ".imported")
+
+
+def _in_range(when, start, end):
+    return (start is None or when >= start) and (end is None or when <= end)
+
+
+# Structured processed-request logs: JSON Lines, or fixed-width binary records
+# laid out as REQUEST_RECORD (little-endian, 76 bytes, details NUL-padded/truncated).
+# request_type is a code into a RequestTypeTable kept next to the log as "<log>.types".
+REQUEST_RECORD = struct.Struct("<ddqbBH48s")
+REQUEST_RECORD_FIELDS = ("processed_time", "original_request_time", "employee_id",
+                         "priority", "approved", "request_type", "details")
+_RECORD_FIELD_FORMATS = ("d", "d", "q", "b", "B", "H", "48s")
+
+
+def _record_field_offsets():
+    offsets, position = {}, 0
+    for name, fmt in zip(REQUEST_RECORD_FIELDS, _RECORD_FIELD_FORMATS):
+        offsets[name] = (position, struct.Struct("<" + fmt))
+        position += struct.calcsize("<" + fmt)
+    return offsets
+
+
+_RECORD_FIELD_OFFSETS = _record_field_offsets()
+
+
+def _fixed_text(value, size):
+    """UTF-8 encode and truncate to size bytes without splitting a character"""
+    return value.encode('utf-8')[:size].decode('utf-8', 'ignore').encode('utf-8')
+
+
+class RequestTypeTable:
+    """Request type names of a binary request log, one JSON string per line.
+
+    Records store a type's code (its line number), so free-text types of any
+    length round-trip whole and equal types always share a code. A new name
+    is appended before the first record that uses it is written.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.names = []  # code -> request type
+        self._codes = {}
+        self._size = 0  # Bytes of complete lines; a torn last line is dropped
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                data = f.read()
+            self._size = data.rfind(b"\n") + 1
+            for line in data[:self._size].splitlines():
+                name = json.loads(line)
+                self._codes.setdefault(name, len(self.names))
+                self.names.append(name)
+
+    def code(self, name):
+        code = self._codes.get(name)
+        if code is None:
+            code = len(self.names)
+            if code > 0xFFFF:
+                raise ValueError("Too many distinct request types for a binary request log")
+            with open(self.path, 'ab') as f:
+                f.truncate(self._size)
+                line = (json.dumps(name) + "\n").encode('utf-8')
+                f.write(line)
+            self._size += len(line)
+            self._codes[name] = code
+            self.names.append(name)
+        return code
+
+    def name(self, code):
+        return self.names[code]
+
+
+def _unpack_field(name, value, types):
+    if name in ("processed_time", "original_request_time"):
+        return datetime.datetime.fromtimestamp(value)
+    if name == "approved":
+        return bool(value)
+    if name == "request_type":
+        return types.name(value)
+    if name == "details":
+        return value.rstrip(b"\0").decode('utf-8', 'ignore')
+    return value
+
+
+def encode_request_record(record, types):
+    """Pack a processed-request dict (as returned by parse_processed_log_line).
+
+    types is the log's RequestTypeTable; the type name is stored as its code.
+    """
+    return REQUEST_RECORD.pack(
+        record['processed_time'].timestamp(),
+        record['original_request_time'].timestamp(),
+        record['employee_id'],
+        record['priority'],
+        record['status'].upper().startswith('APPROVED'),
+        types.code(record['request_type']),
+        _fixed_text(record['details'], 48),
+    )
+
+
+def encode_request_jsonl(record):
+    return json.dumps({
+        'processed_time': record['processed_time'].isoformat(sep=' '),
+        'status': record['status'],
+        'employee_id': record['employee_id'],
+        'request_type': record['request_type'],
+        'priority': record['priority'],
+        'details': record['details'],
+        'original_request_time': record['original_request_time'].isoformat(sep=' '),
+    }) + "\n"
+
+
+def read_jsonl_log(path):
+    """Yield processed-request dicts from a JSON Lines log"""
+    with open(path, 'r') as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                record['processed_time'] = datetime.datetime.fromisoformat(record['processed_time'])
+                record['original_request_time'] = datetime.datetime.fromisoformat(record['original_request_time'])
+                yield record
+
+
+class BinaryRequestLog:
+    """Memory-mapped reader for a fixed-width binary request log"""
+
+    def __init__(self, path):
+        self.types = RequestTypeTable(path + ".types")
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        # A trailing partial record (torn write) is ignored
+        self._count = size // REQUEST_RECORD.size
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self.record(index)
+
+    def record(self, index):
+        values = REQUEST_RECORD.unpack_from(self._map, index * REQUEST_RECORD.size)
+        return {name: _unpack_field(name, value, self.types)
+                for name, value in zip(REQUEST_RECORD_FIELDS, values)}
+
+    def column(self, name):
+        """Values of one field across all records, decoding only that field"""
+        offset, field = _RECORD_FIELD_OFFSETS[name]
+        if field.size == 1:
+            # One byte per record: a strided slice of the map needs no per-record unpacking
+            raw = self._map[offset:self._count * REQUEST_RECORD.size:REQUEST_RECORD.size]
+            if name == "priority":
+                return array('b', raw).tolist()
+            return [bool(value) for value in raw]
+        values = [field.unpack_from(self._map, index * REQUEST_RECORD.size + offset)[0]
+                  for index in range(self._count)]
+        return [_unpack_field(name, value, self.types) for value in values]
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def convert_text_log(source, destination, log_format="jsonl"):
+    """Convert a text processed_requests.log into the jsonl or binary format"""
+    count = 0
+    types = None
+    if log_format == "binary":
+        if os.path.exists(destination + ".types"):
+            os.remove(destination + ".types")  # Codes restart with the new file
+        types = RequestTypeTable(destination + ".types")
+    with open(destination, 'wb' if log_format == "binary" else 'w') as out:
+        for record in read_processed_log(source):
+            out.write(encode_request_record(record, types) if types else encode_request_jsonl(record))
+            count += 1
+    return count
 
 
 # Employee Request class
@@ -271,29 +1565,156 @@ class EmployeeRequest:
 
 
 # Priority Queue for Employee Requests
+class _QueueEntry:
+    """Heap slot for a request; ``removed`` marks a tombstone left by lazy deletion"""
+    __slots__ = ("request", "seq", "removed")
+
+    def __init__(self, request, seq):
+        self.request = request
+        self.seq = seq
+        self.removed = False
+
+    def __lt__(self, other):
+        # Same ordering as EmployeeRequest.__lt__, insertion order breaks exact ties
+        if self.request < other.request:
+            return True
+        if other.request < self.request:
+            return False
+        return self.seq < other.seq
+
+
+def request_fingerprint(employee_id, request_type, request_details):
+    """Normalized key used to spot duplicate requests"""
+    return employee_id, request_type.casefold(), request_details.casefold()
+
+
+def request_tokens(request_details):
+    """Casefolded word set used for near-duplicate matching"""
+    return frozenset(re.findall(r"\w+", request_details.casefold()))
+
+
 class PriorityQueue:
-    def __init__(self):
-        self.requests = []
+    def __init__(self, near_duplicate_threshold=None):
+        self._heap = []  # Binary heap of _QueueEntry (may contain tombstones)
+        self._entries = {}  # request -> live _QueueEntry
+        self._seq = itertools.count()
+        self._sorted_cache = None  # Priority-ordered snapshot served by .requests
+        # Secondary indexes: key -> {request: None} (dicts used as ordered sets)
+        self._by_type = {}
+        self._by_priority = {}
+        self._by_employee = {}
+        self._by_fingerprint = {}
+        # Optional near-duplicate mode: (employee_id, token) -> requests
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self._by_token = {}
+        self._tokens = {}  # request -> token set
         self.undo_stack = []  # Stack for undo operations
         self.redo_stack = []  # Stack for redo operations
 
+    @property
+    def requests(self):
+        """Pending requests in priority order (read-only snapshot)"""
+        if self._sorted_cache is None:
+            self._sorted_cache = [entry.request for entry in sorted(self._entries.values())]
+        return self._sorted_cache
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, request):
+        return request in self._entries
+
+    def __iter__(self):
+        return iter(self.requests)
+
+    def _index_maps(self, request):
+        return ((self._by_type, request.request_type),
+                (self._by_priority, request.priority_level),
+                (self._by_employee, request.employee_id),
+                (self._by_fingerprint, request_fingerprint(
+                    request.employee_id, request.request_type, request.request_details)))
+
+    def _token_keys(self, request):
+        tokens = self._tokens.get(request)
+        if tokens is None:
+            tokens = self._tokens[request] = request_tokens(request.request_details)
+        return [(request.employee_id, token) for token in tokens]
+
+    def _track(self, request, entry):
+        self._entries[request] = entry
+        for index, key in self._index_maps(request):
+            index.setdefault(key, {})[request] = None
+        if self.near_duplicate_threshold is not None:
+            for key in self._token_keys(request):
+                self._by_token.setdefault(key, {})[request] = None
+        self._sorted_cache = None
+
+    def _untrack(self, request):
+        entry = self._entries.pop(request)
+        for index, key in self._index_maps(request):
+            members = index[key]
+            del members[request]
+            if not members:
+                del index[key]
+        if self.near_duplicate_threshold is not None:
+            for key in self._token_keys(request):
+                members = self._by_token[key]
+                del members[request]
+                if not members:
+                    del self._by_token[key]
+            del self._tokens[request]
+        self._sorted_cache = None
+        return entry
+
+    def _push(self, request):
+        entry = _QueueEntry(request, next(self._seq))
+        self._track(request, entry)
+        heapq.heappush(self._heap, entry)
+
+    def _discard(self, request):
+        """Tombstone a request in O(1); the heap slot is dropped when it surfaces"""
+        self._untrack(request).removed = True
+        # Rebuild once tombstones outnumber live entries to keep the heap compact
+        if len(self._heap) > 2 * len(self._entries) + 32:
+            self._heap = [e for e in self._heap if not e.removed]
+            heapq.heapify(self._heap)
+
+    def _pop(self):
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            if not entry.removed:
+                self._untrack(entry.request)
+                return entry.request
+        return None
+
+    def peek(self):
+        """Return the highest priority request without removing it"""
+        while self._heap and self._heap[0].removed:
+            heapq.heappop(self._heap)
+        return self._heap[0].request if self._heap else None
+
     def add_request(self, request):
         """Add a request to the queue and record the operation for undo"""
-        self.requests.append(request)
-        self.requests.sort()  # Maintain priority order
+        self._push(request)
         # Push to undo stack: ('add', request)
         self.undo_stack.append(("add", request))
         # Clear redo stack when new operation is performed
         self.redo_stack.clear()
-        # Removed the print statement that was here
+
+    def remove_request(self, request):
+        """Remove a specific pending request (e.g. one picked from a listing)"""
+        if request not in self._entries:
+            return False
+        self._discard(request)
+        return True
 
     def process_next(self):
         """Process the next request and record for undo"""
-        if not self.requests:
+        request = self._pop()
+        if request is None:
             print(Fore.YELLOW + "No requests to process!" + Style.RESET_ALL)
             return None
 
-        request = self.requests.pop(0)
         # Push to undo stack: ('remove', request)
         self.undo_stack.append(("remove", request))
         self.redo_stack.clear()
@@ -311,8 +1732,8 @@ class PriorityQueue:
 
             if action == "add":
                 # Undo an add operation by removing the request
-                if request in self.requests:
-                    self.requests.remove(request)
+                if request in self._entries:
+                    self._discard(request)
                     self.redo_stack.append(("add", request))
                     print(Fore.GREEN + f"Undo: Removed request (ID: {request.employee_id})" + Style.RESET_ALL)
                 else:
@@ -321,9 +1742,8 @@ class PriorityQueue:
 
             elif action == "remove":
                 # Undo a remove operation by adding back the request
-                if request not in self.requests:
-                    self.requests.append(request)
-                    self.requests.sort()
+                if request not in self._entries:
+                    self._push(request)
                     self.redo_stack.append(("remove", request))
                     print(Fore.GREEN + f"Undo: Restored request (ID: {request.employee_id})" + Style.RESET_ALL)
                 else:
@@ -347,9 +1767,8 @@ class PriorityQueue:
 
             if action == "add":
                 # Redo an add operation
-                if request not in self.requests:
-                    self.requests.append(request)
-                    self.requests.sort()
+                if request not in self._entries:
+                    self._push(request)
                     self.undo_stack.append(("add", request))
                     print(Fore.GREEN + f"Redo: Added request (ID: {request.employee_id})" + Style.RESET_ALL)
                 else:
@@ -358,8 +1777,8 @@ class PriorityQueue:
 
             elif action == "remove":
                 # Redo a remove operation
-                if request in self.requests:
-                    self.requests.remove(request)
+                if request in self._entries:
+                    self._discard(request)
                     self.undo_stack.append(("remove", request))
                     print(Fore.GREEN + f"Redo: Removed request (ID: {request.employee_id})" + Style.RESET_ALL)
                 else:
@@ -372,32 +1791,178 @@ class PriorityQueue:
             print(Fore.RED + f"Error during redo: {str(e)}" + Style.RESET_ALL)
             return False
 
-    def get_stats(self, filter_type=None, filter_priority=None):
+    def get_stats(self, filter_type=None, filter_priority=None, employee_id=None):
+        """Count pending requests, O(1) via the secondary indexes"""
         if filter_type:
-            return len([r for r in self.requests if r.request_type == filter_type])
-        elif filter_priority is not None:
-            return len([r for r in self.requests if r.priority_level == filter_priority])
-        else:
-            return len(self.requests)
-
-    def filter_requests(self, filter_type=None, filter_priority=None):
-        if filter_type and filter_priority is not None:
-            return [r for r in self.requests if r.request_type == filter_type and r.priority_level == filter_priority]
-        elif filter_type:
-            return [r for r in self.requests if r.request_type == filter_type]
+            return len(self._by_type.get(filter_type, ()))
         elif filter_priority is not None:
-            return [r for r in self.requests if r.priority_level == filter_priority]
+            return len(self._by_priority.get(filter_priority, ()))
+        elif employee_id is not None:
+            return len(self._by_employee.get(employee_id, ()))
         else:
+            return len(self._entries)
+
+    def find_duplicates(self, employee_id, request_type, request_details):
+        """Pending requests with the same employee, type and details (case-insensitive)"""
+        key = request_fingerprint(employee_id, request_type, request_details)
+        return list(self._by_fingerprint.get(key, ()))
+
+    def find_similar(self, employee_id, request_type, request_details):
+        """Pending requests of the same type whose details share enough words.
+
+        Only available when the queue was created with a near_duplicate_threshold;
+        candidates come from the token index, so cost depends on the overlap
+        rather than on the size of the queue.
+        """
+        if self.near_duplicate_threshold is None:
+            return []
+        tokens = request_tokens(request_details)
+        if not tokens:
+            return []
+
+        shared = defaultdict(int)
+        for token in tokens:
+            for request in self._by_token.get((employee_id, token), ()):
+                shared[request] += 1
+
+        request_type = request_type.casefold()
+        similar = []
+        for request, overlap in shared.items():
+            if request.request_type.casefold() != request_type:
+                continue
+            union = len(tokens) + len(self._tokens[request]) - overlap
+            if overlap / union >= self.near_duplicate_threshold:
+                similar.append(request)
+        return similar
+
+    def get_types(self):
+        """Sorted request types that currently have pending requests"""
+        return sorted(self._by_type)
+
+    def get_priority_counts(self):
+        """Pending request count per priority level, from the priority index"""
+        return {priority: len(members) for priority, members in sorted(self._by_priority.items())}
+
+    def filter_requests(self, filter_type=None, filter_priority=None, employee_id=None):
+        """Pending requests matching every given filter, in priority order"""
+        candidates = [index.get(key, {}) for index, key in ((self._by_type, filter_type),
+                                                            (self._by_priority, filter_priority),
+                                                            (self._by_employee, employee_id))
+                      if key is not None and key != ""]
+        if not candidates:
             return self.requests.copy()
 
+        # Walk the smallest member set and check the rest by hash lookup
+        candidates.sort(key=len)
+        smallest, others = candidates[0], candidates[1:]
+        matches = [r for r in smallest if all(r in other for other in others)]
+        return [entry.request for entry in sorted(self._entries[r] for r in matches)]
+
+
+def _department_name_key(employee, seq):
+    return employee.department.casefold(), employee.name.casefold(), seq
+
+
+def _programme_key(employee, seq):
+    return len(employee.programmes), employee.employee_id, seq
+
+
+def _programme_desc_key(employee, seq):
+    return -len(employee.programmes), employee.employee_id, seq
+
+
+def _bottom_up_merge_sort(items):
+    """Iterative merge sort that ping-pongs between items and one auxiliary buffer"""
+    n = len(items)
+    src = list(items)
+    dst = [None] * n
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                if src[j] < src[i]:
+                    dst[k] = src[j]
+                    j += 1
+                else:
+                    dst[k] = src[i]
+                    i += 1
+                k += 1
+            # Copy whichever run is left over
+            if i < mid:
+                dst[k:hi] = src[i:mid]
+            else:
+                dst[k:hi] = src[j:hi]
+        src, dst = dst, src
+        width *= 2
+    return src
+
+
+def _quicksort_in_place(items):
+    """Iterative in-place quick sort (median-of-three, three-way partition)"""
+    stack = [(0, len(items) - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        while lo < hi:
+            mid = (lo + hi) // 2
+            pivot = sorted((items[lo], items[mid], items[hi]))[1]
+            lt, i, gt = lo, lo, hi
+            while i <= gt:
+                if items[i] < pivot:
+                    items[lt], items[i] = items[i], items[lt]
+                    lt += 1
+                    i += 1
+                elif pivot < items[i]:
+                    items[i], items[gt] = items[gt], items[i]
+                    gt -= 1
+                else:
+                    i += 1
+            # Loop on the smaller side and defer the larger one to keep the stack shallow
+            if lt - lo < hi - gt:
+                stack.append((gt + 1, hi))
+                hi = lt - 1
+            else:
+                stack.append((lo, lt - 1))
+                lo = gt + 1
+
 
 class EmployeeManagementSystem:
-    def __init__(self):
+    def __init__(self, near_duplicate_threshold=None):
         self.employees = []
+        self._employees_by_id = {}  # employee_id -> Employee, kept in step with self.employees
+        self._employee_seq = {}  # Employee -> load order, keeps equal sort keys stable
+        self._store = EmployeeStore()  # Columnar copy of self.employees; row == load order
+        # Or "quicksort" for the in-place iterative sort, or "columnar" to sort on an EmployeeStore
+        self.sort_algorithm = "timsort"
+        self._views = None  # Materialized sorted views, built on first use
+        self._metrics = DashboardMetrics()  # Dashboard figures, kept current per event
+        self.page_size = 50  # Rows per screen in long listings
         self.tree = EmployeeTree()
-        self.request_queue = PriorityQueue()
+        # Set to a Jaccard ratio (e.g. 0.6) to also warn about near-duplicate requests
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self.request_queue = PriorityQueue(near_duplicate_threshold)
         self.data_file = "employees.json"
         self.requests_file = "processed_requests.log"
+        self._request_log = RequestLogWriter(self.requests_file)
+        # New decisions go to rotated segments ("daily"/"monthly"; None keeps the single file).
+        # Anything already in requests_file is still read alongside the segments.
+        self.log_rotation = "monthly"
+        self._segments = SegmentedRequestLog(os.path.splitext(self.requests_file)[0] + ".d",
+                                             self.log_rotation or "monthly")
+        # Optionally also write "jsonl" or "binary" records next to the text log
+        self.structured_log_format = None
+        self._structured_log = None
+        self._request_types = None  # RequestTypeTable of the binary log
+        # Aggregated request_stats plus how far into requests_file they cover
+        self.stats_checkpoint_file = "processed_requests.checkpoint"
+
+        # Mutations are appended here and folded into data_file every N records
+        self.journal_file = "employees.journal"
+        self.journal_compact_every = 200
+        self._journal_seq = 0
+        self._journal_pending = 0
 
         # Initialize empty stats first
         self.request_stats = {
@@ -412,9 +1977,7 @@ class EmployeeManagementSystem:
         self._initialize_data()
 
         # Load historical requests and update stats
-        historical_requests = self._load_processed_requests()
-        for req in historical_requests:
-            self._update_request_stats_from_dict(req)
+        self._load_request_stats()
 
     def generate_dummy_requests(self):
         request_types = ["Logistics", "Maintenance", "Support", "Technical", "IT", "Others"]
@@ -438,20 +2001,32 @@ class EmployeeManagementSystem:
             new_request.status = "PENDING"
 
             self.request_queue.add_request(new_request)
+            self._journal_request_added(new_request)
 
-        self._save_to_json()
         print(f"✅ Generated 20 dummy requests for employee IDs 10001–10020.")
 
-    def view_processed_requests(self):
+    def view_processed_requests(self, start=None, end=None):
+        """Show the processed-request log, optionally only entries processed in [start, end]"""
         self.display_header("PROCESSED REQUESTS LOG")
 
-        if not os.path.exists(self.requests_file):
+        self._flush_request_logs()
+        segments = self._segments.segments(start, end)
+        if not os.path.exists(self.requests_file) and not segments:
             print(Fore.YELLOW + "No processed requests log found!" + Style.RESET_ALL)
             return
 
         try:
-            with open(self.requests_file, 'r') as f:
-                log_contents = f.read()
+            log_contents = ""
+            if os.path.exists(self.requests_file):
+                with open(self.requests_file, 'r') as f:
+                    if start is None and end is None:
+                        log_contents = f.read()
+                    else:
+                        log_contents = "".join(
+                            line for line in f
+                            if (record := parse_processed_log_line(line))
+                            and _in_range(record['processed_time'], start, end))
+            log_contents += "".join(self._segments.lines(start, end))
 
             if not log_contents.strip():
                 print(Fore.YELLOW + "The processed requests log is empty" + Style.RESET_ALL)
@@ -467,7 +2042,8 @@ class EmployeeManagementSystem:
             print(Fore.RED + f"Error reading log file: {str(e)}" + Style.RESET_ALL)
 
     def _log_request(self, request, action):
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")
+        processed_time = datetime.datetime.now()
+        timestamp = processed_time.strftime("%Y-%m-%d %H:%M:%S.%f")
         log_entry = (
             f"{timestamp}: {action.upper()}: "
             f"Employee ID: {request.employee_id}, "
@@ -477,8 +2053,39 @@ class EmployeeManagementSystem:
             f"Status: {request.status}, "
             f"Timestamp: {request.timestamp}\n"
         )
-        with open(self.requests_file, 'a') as f:
-            f.write(log_entry)
+        record = {
+            'processed_time': processed_time,
+            'status': action.upper(),
+            'employee_id': request.employee_id,
+            'request_type': request.request_type,
+            'priority': request.priority_level,
+            'details': request.request_details,
+            'original_request_time': request.timestamp,
+        }
+
+        if self.log_rotation:
+            self._segments.period = self.log_rotation
+            self._segments.append(log_entry, record)
+        else:
+            self._request_log.write(log_entry)
+
+        if self.structured_log_format:
+            binary = self.structured_log_format == "binary"
+            if self._structured_log is None or self._structured_log.binary != binary:
+                if self._structured_log is not None:
+                    self._structured_log.close()
+                suffix = ".bin" if binary else ".jsonl"
+                self._structured_log = RequestLogWriter(
+                    os.path.splitext(self.requests_file)[0] + suffix, binary=binary)
+                self._request_types = RequestTypeTable(self._structured_log.path + ".types") if binary else None
+            self._structured_log.write(encode_request_record(record, self._request_types) if binary
+                                       else encode_request_jsonl(record))
+
+    def _flush_request_logs(self):
+        self._request_log.flush()
+        self._segments.flush()
+        if self._structured_log is not None:
+            self._structured_log.flush()
 
     def display_header(self, title):
         print(Fore.BLUE + "\n" + "=" * 50)
@@ -514,10 +2121,7 @@ class EmployeeManagementSystem:
                 print(Fore.RED + "\nInvalid admin password!" + Style.RESET_ALL)
                 return False
 
-            admin = next(
-                (emp for emp in self.employees if emp.employee_id == 99999),
-                None
-            )
+            admin = self.get_employee(99999)
 
             if not admin:
                 admin = Employee(
@@ -529,8 +2133,8 @@ class EmployeeManagementSystem:
                     salary="100000",
                     is_admin=True
                 )
-                self.employees.append(admin)
-                self._save_to_json()
+                self.add_employee(admin)
+                self._journal_employee_added(admin)
 
             self.current_user = admin
             print(Fore.GREEN + "\nWelcome, System Admin!" + Style.RESET_ALL)
@@ -542,10 +2146,7 @@ class EmployeeManagementSystem:
                 print(Fore.RED + "\nInvalid employee password!" + Style.RESET_ALL)
                 return False
 
-            employee = next(
-                (emp for emp in self.employees if emp.employee_id == emp_id),
-                None
-            )
+            employee = self.get_employee(emp_id)
 
             if not employee:
                 employee = Employee(
@@ -557,8 +2158,8 @@ class EmployeeManagementSystem:
                     salary="50000",
                     is_admin=False
                 )
-                self.employees.append(employee)
-                self._save_to_json()
+                self.add_employee(employee)
+                self._journal_employee_added(employee)
 
             self.current_user = employee
             print(
@@ -582,7 +2183,7 @@ class EmployeeManagementSystem:
         if os.path.exists(self.data_file):
             self._load_from_json()
         else:
-
+            self._replay_journal(0)
             self._save_to_json()
         # Add this line to build the tree after loading data
         self.tree = self.build_tree()
@@ -608,6 +2209,8 @@ class EmployeeManagementSystem:
             with open(self.data_file, 'r') as f:
                 data = json.load(f)
                 self._process_json_data(data)
+            self._journal_seq = data.get("journal_seq", 0)
+            self._replay_journal(self._journal_seq)
             print(Fore.GREEN + "\nData loaded successfully!" + Style.RESET_ALL)
             self.tree = self.build_tree()
         except Exception as e:
@@ -616,33 +2219,53 @@ class EmployeeManagementSystem:
     def _process_json_data(self, data):
         """Load and decrypt data from JSON file"""
         self.employees = []
-        for emp_data in data.get("employees", []):
-            # Decrypt all encrypted fields
-            name = emp_data["name"]
-            if name.startswith('enc:'):
-                name = simple_decrypt(name[4:])
-
-            email = emp_data["email"]
-            if email.startswith('enc:'):
-                email = simple_decrypt(email[4:])
-
-            salary = emp_data.get("salary", "50000")
-            if isinstance(salary, str) and salary.startswith('enc:'):
-                salary = simple_decrypt(salary[4:])
-
-            programmes = []
-            for prog in emp_data.get("programmes", []):
-                if isinstance(prog, str) and prog.startswith('enc:'):
-                    programmes.append(simple_decrypt(prog[4:]))
-                else:
-                    programmes.append(prog)
+        self._employees_by_id = {}
+        self._employee_seq = {}
+        self._store = EmployeeStore()
+        self._views = None
+        self._metrics = DashboardMetrics()
+        for emp in self._employees_from_dicts(data.get("employees", [])):
+            self.add_employee(emp)
 
-            enrollment_history = []
-            for entry in emp_data.get("enrollment_history", []):
-                if isinstance(entry, str) and entry.startswith('enc:'):
-                    enrollment_history.append(simple_decrypt(entry[4:]))
-                else:
-                    enrollment_history.append(entry)
+        # Process requests
+        self.request_queue = PriorityQueue(self.near_duplicate_threshold)
+        for req_data in data.get("requests", []):
+            self.request_queue.add_request(self._request_from_dict(req_data))
+
+        self.tree = self.build_tree()
+        if not any(emp.is_admin for emp in self.employees):
+            self.tree._initialize_admin()
+
+    def _employee_from_dict(self, emp_data):
+        """Build an Employee from its stored (encrypted) dictionary"""
+        return self._employees_from_dicts([emp_data])[0]
+
+    def _employees_from_dicts(self, records):
+        """Build Employees from stored dictionaries, decrypting all their fields as one column"""
+        def fields(emp_data):
+            yield emp_data["name"]
+            yield emp_data["email"]
+            yield emp_data.get("salary", "50000")
+            yield from emp_data.get("programmes", [])
+            yield from emp_data.get("enrollment_history", [])
+
+        encrypted = [value[4:] for emp_data in records for value in fields(emp_data)
+                     if isinstance(value, str) and value.startswith('enc:')]
+        decrypted = iter(simple_decrypt_many(encrypted))
+
+        def plain(value):
+            if isinstance(value, str) and value.startswith('enc:'):
+                return next(decrypted)
+            return value
+
+        employees = []
+        for emp_data in records:
+            # Fields are read back in the order fields() listed them
+            name = plain(emp_data["name"])
+            email = plain(emp_data["email"])
+            salary = plain(emp_data.get("salary", "50000"))
+            programmes = [plain(p) for p in emp_data.get("programmes", [])]
+            enrollment_history = [plain(e) for e in emp_data.get("enrollment_history", [])]
 
             emp = Employee(
                 name,
@@ -656,90 +2279,280 @@ class EmployeeManagementSystem:
             )
 
             # Add decrypted enrollment history
-            for entry in enrollment_history:
-                emp.enrollment_history.append(entry)
+            emp.enrollment_history.extend(enrollment_history)
+            employees.append(emp)
+        return employees
 
-            self.employees.append(emp)
+    def _employee_to_dict(self, emp):
+        """Stored (encrypted) dictionary form of an Employee"""
+        return self._employees_to_dicts([emp])[0]
 
-        # Process requests
-        self.request_queue = PriorityQueue()
-        for req_data in data.get("requests", []):
-            request_type = req_data["request_type"]
-            if request_type.startswith('enc:'):
-                request_type = simple_decrypt(request_type[4:])
-
-            details = req_data["request_details"]
-            if details.startswith('enc:'):
-                details = simple_decrypt(details[4:])
-
-            status = req_data["status"]
-            if status.startswith('enc:'):
-                status = simple_decrypt(status[4:])
-
-            req = EmployeeRequest(
-                req_data["employee_id"],
-                request_type,
-                req_data["priority_level"],
-                details
-            )
-            req.timestamp = datetime.datetime.strptime(req_data["timestamp"], "%Y-%m-%d %H:%M:%S.%f")
-            req.status = status
-            self.request_queue.add_request(req)
+    def _employees_to_dicts(self, employees):
+        """Stored dictionaries for many employees, encrypting all their fields as one column"""
+        plain = []
+        for emp in employees:
+            plain += (emp._name, emp._email, str(emp._salary))
+            plain.extend(emp.programmes)
+            plain.extend(emp.enrollment_history)
+        encrypted = iter(simple_encrypt_many(plain))
+
+        # Dict displays evaluate in order, matching the order plain was built in
+        return [{
+            "name": f"enc:{next(encrypted)}",
+            "employee_id": emp.employee_id,
+            "email": f"enc:{next(encrypted)}",
+            "department": emp.department,
+            "is_full_time": emp.is_full_time,
+            "salary": f"enc:{next(encrypted)}",
+            "programmes": [f"enc:{next(encrypted)}" for _ in emp.programmes],
+            "enrollment_history": [f"enc:{next(encrypted)}" for _ in range(len(emp.enrollment_history))],
+            "is_admin": emp.is_admin
+        } for emp in employees]
+
+    def _request_from_dict(self, req_data):
+        """Build an EmployeeRequest from its stored (encrypted) dictionary"""
+        request_type = req_data["request_type"]
+        if request_type.startswith('enc:'):
+            request_type = simple_decrypt(request_type[4:])
+
+        details = req_data["request_details"]
+        if details.startswith('enc:'):
+            details = simple_decrypt(details[4:])
+
+        status = req_data["status"]
+        if status.startswith('enc:'):
+            status = simple_decrypt(status[4:])
+
+        req = EmployeeRequest(
+            req_data["employee_id"],
+            request_type,
+            req_data["priority_level"],
+            details
+        )
+        req.timestamp = datetime.datetime.strptime(req_data["timestamp"], "%Y-%m-%d %H:%M:%S.%f")
+        req.status = status
+        return req
 
-        self.tree = self.build_tree()
-        if not any(emp.is_admin for emp in self.employees):
-            self.tree._initialize_admin()
+    def _request_to_dict(self, req):
+        """Stored (encrypted) dictionary form of an EmployeeRequest"""
+        return {
+            "employee_id": req.employee_id,
+            "request_type": f"enc:{simple_encrypt(req.request_type)}",
+            "priority_level": req.priority_level,
+            "request_details": f"enc:{simple_encrypt(req.request_details)}",
+            "timestamp": req.timestamp.strftime("%Y-%m-%d %H:%M:%S.%f"),
+            "status": f"enc:{simple_encrypt(req.status)}"
+        }
 
     def _save_to_json(self):
-        """Save all employee data with encrypted sensitive fields"""
+        """Save all employee data with encrypted sensitive fields.
+
+        This is the full snapshot; it also compacts the journal, whose records
+        are all folded into the snapshot at this point.
+        """
+        self._flush_request_logs()
         data = {
-            "employees": [{
-                "name": f"enc:{simple_encrypt(emp._name)}",
-                "employee_id": emp.employee_id,
-                "email": f"enc:{simple_encrypt(emp._email)}",
-                "department": emp.department,
-                "is_full_time": emp.is_full_time,
-                "salary": f"enc:{simple_encrypt(str(emp._salary))}",
-                "programmes": [f"enc:{simple_encrypt(p)}" for p in emp.programmes],
-                "enrollment_history": [f"enc:{simple_encrypt(e)}" for e in emp._serialize_enrollment_history()],
-                "is_admin": emp.is_admin
-            } for emp in self.employees],
-            "requests": []
+            "employees": self._employees_to_dicts(self.employees),
+            "requests": [],
+            "journal_seq": self._journal_seq
         }
 
         # Encrypt request data if needed
-        if hasattr(self, 'request_queue') and hasattr(self.request_queue, 'requests'):
+        if hasattr(self, 'request_queue'):
             for req in self.request_queue.requests:
-                req_data = {
-                    "employee_id": req.employee_id,
-                    "request_type": f"enc:{simple_encrypt(req.request_type)}",
-                    "priority_level": req.priority_level,
-                    "request_details": f"enc:{simple_encrypt(req.request_details)}",
-                    "timestamp": req.timestamp.strftime("%Y-%m-%d %H:%M:%S.%f"),
-                    "status": f"enc:{simple_encrypt(req.status)}"
-                }
-                data["requests"].append(req_data)
+                data["requests"].append(self._request_to_dict(req))
 
         try:
-            with open(self.data_file, 'w') as f:
+            # Write to a temp file first so a crash never leaves a half-written snapshot
+            temp_file = self.data_file + ".tmp"
+            with open(temp_file, 'w') as f:
                 json.dump(data, f, indent=2)
+            os.replace(temp_file, self.data_file)
+            if os.path.exists(self.journal_file):
+                os.remove(self.journal_file)
+            self._journal_pending = 0
             print(Fore.GREEN + "Data encrypted and saved successfully!" + Style.RESET_ALL)
         except Exception as e:
             print(Fore.RED + f"Error saving encrypted data: {str(e)}" + Style.RESET_ALL)
 
+    def _journal_append(self, op, payload):
+        """Append one mutation record to the journal instead of rewriting the snapshot"""
+        self._journal_seq += 1
+        record = {"seq": self._journal_seq, "op": op, **payload}
+        try:
+            with open(self.journal_file, 'a') as f:
+                f.write(json.dumps(record, separators=(',', ':')) + "\n")
+        except Exception as e:
+            print(Fore.RED + f"Error writing journal: {str(e)}" + Style.RESET_ALL)
+            self._save_to_json()
+            return
+
+        self._journal_pending += 1
+        if self._journal_pending >= self.journal_compact_every:
+            self._save_to_json()
+
+    def _journal_request_added(self, request):
+        self._journal_append("add_request", {"request": self._request_to_dict(request)})
+
+    def _journal_request_processed(self, request):
+        # The log line goes to disk before the journal drops the request from the queue
+        self._flush_request_logs()
+        self._journal_append("process_request", {
+            "employee_id": request.employee_id,
+            "timestamp": request.timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")
+        })
+
+    def _journal_request_removed(self, request):
+        self._journal_append("remove_request", {
+            "employee_id": request.employee_id,
+            "timestamp": request.timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")
+        })
+
+    def _journal_employee_added(self, employee):
+        self._journal_append("add_employee", {"employee": self._employee_to_dict(employee)})
+
+    def _replay_journal(self, snapshot_seq):
+        """Apply journal records written after the snapshot was taken"""
+        if not os.path.exists(self.journal_file):
+            return
+
+        pending = {(req.employee_id, req.timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")): req
+                   for req in self.request_queue.requests}
+        replayed = 0
+        with open(self.journal_file, 'r') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break  # Torn final write; everything before it is intact
+                if record["seq"] <= snapshot_seq:
+                    continue
+
+                op = record["op"]
+                if op == "add_request":
+                    req = self._request_from_dict(record["request"])
+                    self.request_queue.add_request(req)
+                    pending[(req.employee_id, record["request"]["timestamp"])] = req
+                elif op in ("process_request", "remove_request"):
+                    req = pending.pop((record["employee_id"], record["timestamp"]), None)
+                    if req is not None:
+                        self.request_queue.remove_request(req)
+                elif op == "add_employee":
+                    self.add_employee(self._employee_from_dict(record["employee"]))
+                self._journal_seq = record["seq"]
+                replayed += 1
+
+        self._journal_pending = replayed
+        if replayed:
+            self.tree = self.build_tree()
+
     def _serialize_enrollment_history(self, employee):
-        history = []
-        current = employee.enrollment_history.head
-        while current:
-            history.append(current.data)
-            current = current.next
-        return history
+        return list(employee.enrollment_history)
 
     def _auto_save(self):
         self._save_to_json()
 
+    def add_employee(self, employee):
+        """Add an employee and register it in the ID index"""
+        self.employees.append(employee)
+        # First record wins, matching the old first-match linear search
+        self._employees_by_id.setdefault(employee.employee_id, employee)
+        seq = self._employee_seq[employee] = len(self._employee_seq)
+        employee._observer = self._employee_changed
+        self._store.append(employee)
+        self._metrics.add_employee(employee)
+        if not employee.is_admin:  # The tree keeps its own Organization-level admin
+            self.tree.add_department(employee.department)
+            self.tree.add_employee(employee, employee.department)
+        if self._views is not None and not employee.is_admin:
+            self._file_in_views(employee, seq)
+
+    def _employee_changed(self, employee):
+        """Re-file an employee whose sort keys may have changed (e.g. a new programme)"""
+        self._metrics.employee_changed(employee)
+        self._store.set_programmes(self._employee_seq[employee], employee.programmes)
+        if self._views is None or employee not in self._views["department_name"]:
+            return
+        for view in self._views_of(employee):
+            view.remove(employee)
+        self._file_in_views(employee, self._employee_seq[employee])
+
+    def _views_of(self, employee):
+        return (self._views["department_name"], self._views["programmes_desc"],
+                self._views["departments"][employee.department])
+
+    def _file_in_views(self, employee, seq):
+        if employee.department not in self._views["departments"]:
+            self._views["departments"][employee.department] = SortedView(_programme_key)
+        for view in self._views_of(employee):
+            view.insert(employee, seq)
+
+    def _ensure_views(self):
+        """Build the sorted views once; afterwards they are maintained incrementally"""
+        if self._views is not None:
+            return self._views
+
+        if self.sort_algorithm == "columnar":
+            return self._ensure_views_from_store()
+
+        entries = [(emp, self._employee_seq[emp]) for emp in self.employees if not emp.is_admin]
+        by_department = defaultdict(list)
+        for emp, seq in entries:
+            by_department[emp.department].append((emp, seq))
+
+        department_name = SortedView(_department_name_key)
+        department_name.load(entries, _quicksort_in_place if self.sort_algorithm == "quicksort" else None)
+        programmes_desc = SortedView(_programme_desc_key)
+        programmes_desc.load(entries)
+        departments = {}
+        for department, members in by_department.items():
+            departments[department] = SortedView(_programme_key)
+            departments[department].load(members, _bottom_up_merge_sort)
+
+        self._views = {
+            "department_name": department_name,
+            "programmes_desc": programmes_desc,
+            "departments": departments,
+        }
+        return self._views
+
+    def _ensure_views_from_store(self):
+        """Build the sorted views from row orders computed on the EmployeeStore"""
+        store = self._store
+
+        def entries(rows):
+            # Rows are load order, so each maps straight back to its Employee and seq
+            return [(self.employees[row], row) for row in rows]
+
+        department_name = SortedView(_department_name_key)
+        department_name.load_sorted(entries(store.order_by_department_name()))
+        programmes_desc = SortedView(_programme_desc_key)
+        programmes_desc.load_sorted(entries(store.order_by_programmes(descending=True)))
+        rows_by_code = defaultdict(list)
+        for row in store.rows():
+            rows_by_code[store.department_codes[row]].append(row)
+        departments = {}
+        for code, rows in rows_by_code.items():
+            departments[store.departments[code]] = SortedView(_programme_key)
+            departments[store.departments[code]].load_sorted(entries(store.order_by_programmes(rows)))
+
+        self._views = {
+            "department_name": department_name,
+            "programmes_desc": programmes_desc,
+            "departments": departments,
+        }
+        return self._views
+
+    def get_employee(self, employee_id):
+        """O(1) lookup of an employee by ID, or None"""
+        return self._employees_by_id.get(employee_id)
+
+    def employee_store(self):
+        """Columnar copy of the current employees (see EmployeeStore), kept in step with them"""
+        return self._store
+
     def validate_employee_id(self, employee_id):
-        return any(emp.employee_id == employee_id for emp in self.employees)
+        return employee_id in self._employees_by_id
 
     def get_input(self, prompt):
         return input(Fore.YELLOW + prompt + Style.RESET_ALL)
@@ -785,10 +2598,10 @@ class EmployeeManagementSystem:
             choice = self.get_input("\nEnter your choice: ")
 
             if choice == "1":
-                if not self.request_queue.undo():
+                if not self._undo_redo("undo"):
                     print(Fore.RED + "Undo failed - no operations to undo" + Style.RESET_ALL)
             elif choice == "2":
-                if not self.request_queue.redo():
+                if not self._undo_redo("redo"):
                     print(Fore.RED + "Redo failed - no operations to redo" + Style.RESET_ALL)
             elif choice == "3":
                 self.display_operation_history()
@@ -801,6 +2614,18 @@ class EmployeeManagementSystem:
 
             input("\nPress Enter to continue...")
 
+    def _undo_redo(self, operation):
+        """Run the queue's undo or redo and journal whether the request is now pending"""
+        stack = self.request_queue.undo_stack if operation == "undo" else self.request_queue.redo_stack
+        request = stack[-1][1] if stack else None
+        done = getattr(self.request_queue, operation)()
+        if done:
+            if request in self.request_queue:
+                self._journal_request_added(request)
+            else:
+                self._journal_request_removed(request)
+        return done
+
     def display_operation_history(self):
         """Display the undo/redo history"""
         print("\n" + "=" * 50)
@@ -842,133 +2667,120 @@ class EmployeeManagementSystem:
                 print(Fore.RED + "Invalid choice, please try again." + Style.RESET_ALL)
             input("\nPress Enter to continue...")
 
-    def quick_sort_by_department(self):
-        """Quick sort implementation for sorting by department (A-Z) and name (A-Z)"""
-        employees = [emp for emp in self.employees if not emp.is_admin]
-
-        def _quicksort(arr):
-            if len(arr) <= 1:
-                return arr
-
-            pivot = arr[len(arr) // 2]
-
-            left = []
-            middle = []
-            right = []
-
-            for emp in arr:
-                # First compare departments (case-insensitive)
-                if emp.department.lower() < pivot.department.lower():
-                    left.append(emp)
-                elif emp.department.lower() > pivot.department.lower():
-                    right.append(emp)
-                else:
-                    # For same department, compare names (case-insensitive)
-                    if emp.name.lower() < pivot.name.lower():
-                        left.append(emp)
-                    elif emp.name.lower() > pivot.name.lower():
-                        right.append(emp)
-                    else:
-                        middle.append(emp)
-
-            return _quicksort(left) + middle + _quicksort(right)
+    def quick_sort_by_department(self, algorithm=None):
+        """Sort non-admin employees by department (A-Z) and name (A-Z), case-insensitive.
+
+        By default this reads the materialized view, so repeated calls only copy
+        the result. Passing algorithm ("timsort", "quicksort" for the in-place
+        iterative quick sort, or "columnar" to sort row indices of an
+        EmployeeStore) forces a fresh sort with that algorithm.
+        """
+        if algorithm is None:
+            return self._ensure_views()["department_name"].items()
+        if algorithm == "columnar":
+            # Store rows follow self.employees, so rows map straight back to the objects
+            return [self.employees[row] for row in self.employee_store().order_by_department_name()]
+
+        view = SortedView(_department_name_key)
+        view.load([(emp, self._employee_seq[emp]) for emp in self.employees if not emp.is_admin],
+                  _quicksort_in_place if algorithm == "quicksort" else None)
+        return view.items()
+
+    def _paginate(self, rows, render_page):
+        """Show rows a page at a time; render_page(page_rows, offset) returns the lines.
+
+        Only the visible page is formatted, and it goes out in one write, so the
+        first screen appears immediately however long the listing is.
+        """
+        cursor = PageCursor(rows, self.page_size)
+        while True:
+            write_lines(render_page(cursor.current(), cursor.offset))
+            if cursor.pages == 1:
+                return
 
-        return _quicksort(employees)
+            choice = self.get_input(
+                f"Page {cursor.page_number}/{cursor.pages} - [n]ext, [p]revious, "
+                f"page number, or Enter to finish: ").strip().lower()
+            if choice == "n":
+                if not cursor.next():
+                    print(Fore.YELLOW + "Already on the last page." + Style.RESET_ALL)
+            elif choice == "p":
+                if not cursor.previous():
+                    print(Fore.YELLOW + "Already on the first page." + Style.RESET_ALL)
+            elif choice.isdigit():
+                if not cursor.goto(int(choice)):
+                    print(Fore.RED + "No such page!" + Style.RESET_ALL)
+            else:
+                return
 
     def display_quick_sorted_employees(self, employees=None):
         """Display employees sorted by department and name"""
         if employees is None:
-            employees = self.quick_sort_by_department()
+            employees = self._ensure_views()["department_name"]
 
         if not employees:
             print(Fore.RED + "No employees found!" + Style.RESET_ALL)
             return
 
-
-
         # Different column widths for admin vs non-admin
-        if hasattr(self, 'current_user') and self.current_user.is_admin:
-            print(f"{'Department':<15}{'Name':<20}{'ID':<10}{'Type':<12}{'Programmes':<15}{'Email':<30}{'Salary':<10}")
+        is_admin = hasattr(self, 'current_user') and self.current_user.is_admin
+        if is_admin:
+            header = f"{'Department':<15}{'Name':<20}{'ID':<10}{'Type':<12}{'Programmes':<15}{'Email':<30}{'Salary':<10}"
         else:
-            print(f"{'Department':<15}{'Name':<20}{'ID':<10}{'Type':<12}{'Programmes':<15}")
-        print("==================================================================")
-
-        current_dept = None
-        for emp in employees:
-            if emp.department != current_dept:
-                current_dept = emp.department
-                print(Fore.YELLOW + f"\n{current_dept}" + Style.RESET_ALL)
-
-            if hasattr(self, 'current_user') and self.current_user.is_admin:
-                print(f"{emp.department:<15}{emp.name:<20}{emp.employee_id:<10}"
-                      f"{'Full-time' if emp.is_full_time else 'Part-time':<12}"
-                      f"{len(emp.programmes):<15}{emp.email:<30}{emp.salary:<10}")
-            else:
-                print(f"{emp.department:<15}{emp.name:<20}{emp.employee_id:<10}"
-                      f"{'Full-time' if emp.is_full_time else 'Part-time':<12}"
-                      f"{len(emp.programmes):<15}")
-
-        print("==================================================================")
+            header = f"{'Department':<15}{'Name':<20}{'ID':<10}{'Type':<12}{'Programmes':<15}"
+        rule = "=================================================================="
+
+        def render_page(page, offset):
+            lines = [header, rule]
+            current_dept = None
+            for emp in page:
+                if emp.department != current_dept:
+                    current_dept = emp.department
+                    lines.append(Fore.YELLOW + f"\n{current_dept}" + Style.RESET_ALL)
+
+                row = (f"{emp.department:<15}{emp.name:<20}{emp.employee_id:<10}"
+                       f"{'Full-time' if emp.is_full_time else 'Part-time':<12}"
+                       f"{len(emp.programmes):<15}")
+                if is_admin:
+                    row += f"{emp.email:<30}{emp.salary:<10}"
+                lines.append(row)
+            lines.append(rule)
+            return lines
+
+        self._paginate(employees, render_page)
 
     def merge_sort_by_programmes(self, employees=None):
-        """Merge sort by number of programmes (ascending) and ID (ascending)"""
-        if employees is None:
-            # Filter out admins, assuming self.employees is a list of Employee objects
-            employees = [emp for emp in self.employees if not emp.is_admin]
+        """Merge sort by number of programmes (ascending) and ID (ascending).
 
-        if len(employees) <= 1:
-            return employees
-
-        mid = len(employees) // 2
-        left = self.merge_sort_by_programmes(employees[:mid])
-        right = self.merge_sort_by_programmes(employees[mid:])
-
-        return self._merge(left, right)
-
-    def _merge(self, left, right):
-        """Merge helper for merge sort"""
-        result = []
-        i = j = 0
-
-        while i < len(left) and j < len(right):
-            left_progs = len(left[i].programmes)
-            right_progs = len(right[j].programmes)
+        Without employees, all non-admin employees are listed by k-way merging
+        the per-department views, which are already in this order.
+        """
+        if employees is None:
+            return self.merge_sorted_partitions(self._ensure_views()["departments"].values())
 
-            if left_progs < right_progs:
-                result.append(left[i])
-                i += 1
-            elif left_progs > right_progs:
-                result.append(right[j])
-                j += 1
-            else:
-                # If equal programmes, compare IDs
-                if left[i].employee_id < right[j].employee_id:
-                    result.append(left[i])
-                    i += 1
-                else:
-                    result.append(right[j])
-                    j += 1
+        # Keys are computed once; the index makes them unique and the merge stable
+        keys = [(len(emp.programmes), emp.employee_id, i) for i, emp in enumerate(employees)]
+        return [employees[key[2]] for key in _bottom_up_merge_sort(keys)]
 
-        result.extend(left[i:])
-        result.extend(right[j:])
-        return result
+    def merge_sorted_partitions(self, partitions):
+        """k-way merge of lists already sorted by (programme count, ID), e.g. per department"""
+        return list(heapq.merge(*partitions, key=lambda emp: (len(emp.programmes), emp.employee_id)))
 
 
     def display_merge_sorted_employees(self, department=None):
         """Display employees sorted by programmes and ID, optionally filtered by department."""
-        employees = [emp for emp in self.employees if not emp.is_admin]
+        # Employees by number of programmes (descending) then by employee ID ascending
+        employees = self._ensure_views()["programmes_desc"]
         if department:
             employees = [emp for emp in employees if emp.department == department]
 
-        # Sort employees by number of programmes (descending) then by employee ID ascending
-        employees.sort(key=lambda e: (-len(e.programmes), e.employee_id))
-
         header_title = f"Employees in {department}" if department else "All Employees"
         self.display_header(header_title)
 
-        for emp in employees:
-            print(f"ID: {emp.employee_id}, Name: {emp.name}, Dept: {emp.department}, "
-                  f"Programmes: {len(emp.programmes)}")
+        self._paginate(employees, lambda page, offset: [
+            f"ID: {emp.employee_id}, Name: {emp.name}, Dept: {emp.department}, "
+            f"Programmes: {len(emp.programmes)}"
+            for emp in page])
 
         input("\nPress Enter to continue...")
 
@@ -978,7 +2790,8 @@ class EmployeeManagementSystem:
             self.display_header("FILTER BY DEPARTMENT - Merge Sort")
 
             # Get sorted unique departments from non-admin employees
-            departments = sorted({emp.department for emp in self.employees if not emp.is_admin})
+            partitions = self._ensure_views()["departments"]
+            departments = sorted(dept for dept, view in partitions.items() if len(view))
 
             print("\nAvailable Departments:")
             for i, dept in enumerate(departments, start=1):
@@ -997,11 +2810,8 @@ class EmployeeManagementSystem:
             elif 1 <= choice <= len(departments):
                 selected_dept = departments[choice - 1]
 
-                # Filter employees by selected department and exclude admins
-                filtered_emps = [emp for emp in self.employees if not emp.is_admin and emp.department == selected_dept]
-
-                # Sort using your merge sort function
-                sorted_emps = self.merge_sort_by_programmes(filtered_emps)
+                # Per-department partition, already sorted by programmes and ID
+                sorted_emps = partitions[selected_dept].items()
 
                 self.display_header(f"Employees in Department: {selected_dept}")
                 if not sorted_emps:
@@ -1028,7 +2838,7 @@ class EmployeeManagementSystem:
                     try:
                         emp_id = int(self.get_input("Enter Employee ID: "))
                         # Validate employee exists
-                        employee = next((emp for emp in self.employees if emp.employee_id == emp_id), None)
+                        employee = self.get_employee(emp_id)
                         if not employee:
                             print(Fore.RED + "Employee ID not found!" + Style.RESET_ALL)
                             continue
@@ -1085,12 +2895,9 @@ class EmployeeManagementSystem:
             details = self.get_input("Enter Request Details: ")
 
             # Enhanced duplicate check with more details
-            duplicate_requests = []
-            for req in self.request_queue.requests:
-                if (req.employee_id == emp_id and
-                        req.request_type.lower() == req_type.lower() and
-                        req.request_details.lower() == details.lower()):
-                    duplicate_requests.append(req)
+            duplicate_requests = self.request_queue.find_duplicates(emp_id, req_type, details)
+            if not duplicate_requests:
+                duplicate_requests = self.request_queue.find_similar(emp_id, req_type, details)
 
             if duplicate_requests:
                 print(Fore.YELLOW + "\nSimilar existing requests found:" + Style.RESET_ALL)
@@ -1106,7 +2913,7 @@ class EmployeeManagementSystem:
             # Create and add the new request
             new_request = EmployeeRequest(emp_id, req_type, priority, details)
             self.request_queue.add_request(new_request)
-            self._save_to_json()
+            self._journal_request_added(new_request)
 
             # Show success message with different info for admin vs regular user
             if self.current_user.is_admin:
@@ -1186,90 +2993,140 @@ class EmployeeManagementSystem:
                 print(f"{priority:<15}{stats['approved']:>10}{stats['rejected']:>10}"
                       f"{total_priority:>10}{rate:>10.1%}")
 
-    def _load_processed_requests(self):
-        """Load processed requests from file with silent error handling"""
-        processed_requests = []
+    def _load_processed_requests(self, start=None, end=None):
+        """Load processed requests (optionally processed within [start, end]) with silent error handling"""
+        self._flush_request_logs()
+        try:
+            processed = []
+            if os.path.exists(self.requests_file):
+                processed = [record for record in read_processed_log(self.requests_file)
+                             if _in_range(record['processed_time'], start, end)]
+            # Only segments overlapping the range are opened
+            processed.extend(self._segments.records(start, end))
+            return processed
+        except Exception:
+            return []
 
+    def migrate_request_log(self):
+        """Move processed_requests.log into the rotated segments and recount request_stats"""
+        self._request_log.close()  # Later writes reopen requests_file afresh
         if not os.path.exists(self.requests_file):
-            return processed_requests
-
+            return
+        self._segments.import_text_log(self.requests_file)
+        # The checkpoint describes the old file; stats now come from the segment summaries
+        if os.path.exists(self.stats_checkpoint_file):
+            os.remove(self.stats_checkpoint_file)
+        self.request_stats['total_processed'] = self.request_stats['approved'] = 0
+        self.request_stats['rejected'] = 0
+        self.request_stats['by_type'].clear()
+        self.request_stats['by_priority'].clear()
+        self._load_request_stats()
+
+    def _processed_request_count(self, start=None, end=None):
+        """Number of processed requests, using segment summaries where possible"""
+        legacy = 0
+        if os.path.exists(self.requests_file):
+            legacy = sum(1 for record in read_processed_log(self.requests_file)
+                         if _in_range(record['processed_time'], start, end))
+        return legacy + self._segments.count(start, end)
+
+    def _load_request_stats(self):
+        """Rebuild request_stats from the checkpoint plus any log lines appended since,
+        then add the rotated segments from their summaries"""
+        self._load_main_log_stats()
         try:
-            with open(self.requests_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    try:
-                        # Split timestamp from rest of line
-                        timestamp_end = line.find(': ')
-                        if timestamp_end == -1:
-                            continue
-
-                        timestamp_str = line[:timestamp_end]
-                        request_data = line[timestamp_end + 2:]  # skip ": "
+            for _, summary in self._segments.segments():
+                self._add_segment_summary_stats(summary)
+        except Exception:
+            pass
 
-                        # Parse timestamp
-                        try:
-                            timestamp = datetime.datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S.%f")
-                        except ValueError:
-                            try:
-                                timestamp = datetime.datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
-                            except ValueError:
-                                continue
+    def _add_segment_summary_stats(self, summary):
+        self.request_stats['total_processed'] += summary["total"]
+        self.request_stats['approved'] += summary["approved"]
+        self.request_stats['rejected'] += summary["rejected"]
+        for request_type, counts in summary["by_type"].items():
+            for outcome, count in counts.items():
+                self.request_stats['by_type'][request_type][outcome] += count
+        for priority, counts in summary["by_priority"].items():
+            for outcome, count in counts.items():
+                self.request_stats['by_priority'][int(priority)][outcome] += count
+
+    def _load_main_log_stats(self):
+        if not os.path.exists(self.requests_file):
+            return
 
-                        # Parse request data
-                        if request_data.startswith("APPROVED: ") or request_data.startswith("REJECTED: "):
-                            status, request_str = request_data.split(': ', 1)
-                            request_str = request_str.strip()
+        try:
+            log_stat = os.stat(self.requests_file)
+            checkpoint = self._read_stats_checkpoint(log_stat)
+            offset = 0
+            if checkpoint:
+                self._restore_request_stats(checkpoint["stats"])
+                offset = checkpoint["offset"]
+
+            with open(self.requests_file, 'rb') as f:
+                f.seek(offset)
+                for raw_line in f:
+                    if not raw_line.endswith(b"\n"):
+                        break  # Partial last line; pick it up next time
+                    offset += len(raw_line)
+                    record = parse_processed_log_line(raw_line.decode('utf-8', 'replace'))
+                    if record is not None:
+                        self._update_request_stats_from_dict(record)
+
+            if not checkpoint or checkpoint["offset"] != offset:
+                self._write_stats_checkpoint(log_stat.st_ino, offset)
+        except Exception:
+            pass
 
-                            try:
-                                # Extract all fields
-                                id_start = request_str.find("ID: ") + 4
-                                id_end = request_str.find(",", id_start)
-                                employee_id = int(request_str[id_start:id_end])
-
-                                type_start = request_str.find("Type: ") + 6
-                                type_end = request_str.find(",", type_start)
-                                request_type = request_str[type_start:type_end].strip()
-
-                                priority_start = request_str.find("Priority: ") + 10
-                                priority_end = request_str.find(",", priority_start)
-                                priority = int(request_str[priority_start:priority_end])
-
-                                details_start = request_str.find("Details: ") + 9
-                                time_label = ", Time:"
-                                details_end = request_str.find(time_label, details_start)
-                                details = request_str[details_start:details_end].strip()
-
-                                request_time_str = request_str[details_end + len(time_label):].strip().rstrip(']')
-                                try:
-                                    request_time = datetime.datetime.strptime(request_time_str, "%Y-%m-%d %H:%M:%S.%f")
-                                except ValueError:
-                                    request_time = datetime.datetime.strptime(request_time_str, "%Y-%m-%d %H:%M:%S")
-
-                                # Add valid request to results
-                                processed_requests.append({
-                                    'processed_time': timestamp,
-                                    'status': status,
-                                    'employee_id': employee_id,
-                                    'request_type': request_type,
-                                    'priority': priority,
-                                    'details': details,
-                                    'original_request_time': request_time,
-                                    'raw_data': request_str
-                                })
-
-                            except (ValueError, IndexError):
-                                continue
-
-                    except Exception:
-                        continue
+    def _log_fingerprint(self, offset):
+        """The bytes just before offset, used to detect a rewritten log"""
+        with open(self.requests_file, 'rb') as f:
+            f.seek(max(0, offset - 64))
+            return f.read(min(offset, 64)).decode('utf-8', 'replace')
 
-        except Exception:
+    def _read_stats_checkpoint(self, log_stat):
+        """Return the checkpoint if it still describes a prefix of the current log"""
+        if not os.path.exists(self.stats_checkpoint_file):
+            return None
+        try:
+            with open(self.stats_checkpoint_file, 'r') as f:
+                checkpoint = json.load(f)
+            if (checkpoint["inode"] == log_stat.st_ino
+                    and checkpoint["offset"] <= log_stat.st_size
+                    and checkpoint["fingerprint"] == self._log_fingerprint(checkpoint["offset"])):
+                return checkpoint
+        except (ValueError, KeyError, OSError):
             pass
+        return None
+
+    def _write_stats_checkpoint(self, inode, offset):
+        checkpoint = {
+            "inode": inode,
+            "offset": offset,
+            "fingerprint": self._log_fingerprint(offset),
+            "stats": {
+                "total_processed": self.request_stats['total_processed'],
+                "approved": self.request_stats['approved'],
+                "rejected": self.request_stats['rejected'],
+                "by_type": dict(self.request_stats['by_type']),
+                # JSON keys are strings, so keep priorities as [level, counts] pairs
+                "by_priority": [[p, c] for p, c in self.request_stats['by_priority'].items()]
+            }
+        }
+        temp_file = self.stats_checkpoint_file + ".tmp"
+        with open(temp_file, 'w') as f:
+            json.dump(checkpoint, f)
+        os.replace(temp_file, self.stats_checkpoint_file)
+
+    def _restore_request_stats(self, stats):
+        self.request_stats['total_processed'] = stats["total_processed"]
+        self.request_stats['approved'] = stats["approved"]
+        self.request_stats['rejected'] = stats["rejected"]
+        for request_type, counts in stats["by_type"].items():
+            self.request_stats['by_type'][request_type].update(counts)
+        for priority, counts in stats["by_priority"]:
+            self.request_stats['by_priority'][priority].update(counts)
 
-        return processed_requests
     def _update_request_stats(self, request, approved=None):
         if approved is None:
             approved = request.status.upper() == "APPROVED"
@@ -1298,7 +3155,7 @@ class EmployeeManagementSystem:
             self.request_stats['by_priority'][request['priority']]['rejected'] += 1
 
     def _display_requests_by_type(self):
-        types = sorted(set(req.request_type for req in self.request_queue.requests))
+        types = self.request_queue.get_types()
         if not types:
             print(Fore.YELLOW + "\nNo requests found!" + Style.RESET_ALL)
             return
@@ -1348,21 +3205,26 @@ class EmployeeManagementSystem:
             print(Fore.YELLOW + f"\nNo {title.lower()} found!" + Style.RESET_ALL)
             return
 
-        print("\n" + "=" * 100)
-        print(title.center(100))
-        print("=" * 100)
-        print(f"{'#':<5}{'Type':<15}{'Priority':<10}{'Employee ID':<12}{'Details':<40}{'Timestamp':<20}")
-        print("=" * 100)
-
         # Sort requests by priority then timestamp
         sorted_requests = sorted(requests, key=lambda x: (x.priority_level, x.timestamp))
 
-        for idx, req in enumerate(sorted_requests, 1):
-            print(f"{idx:<5}{req.request_type:<15}{req.priority_level:<10}{req.employee_id:<12}"
-                  f"{req.request_details[:37] + '...' if len(req.request_details) > 40 else req.request_details:<40}"
-                  f"{req.timestamp.strftime('%Y-%m-%d %H:%M'):<20}")
-
-        print("=" * 100)
+        def render_page(page, offset):
+            lines = [
+                "\n" + "=" * 100,
+                title.center(100),
+                "=" * 100,
+                f"{'#':<5}{'Type':<15}{'Priority':<10}{'Employee ID':<12}{'Details':<40}{'Timestamp':<20}",
+                "=" * 100,
+            ]
+            for idx, req in enumerate(page, offset + 1):
+                lines.append(
+                    f"{idx:<5}{req.request_type:<15}{req.priority_level:<10}{req.employee_id:<12}"
+                    f"{req.request_details[:37] + '...' if len(req.request_details) > 40 else req.request_details:<40}"
+                    f"{req.timestamp.strftime('%Y-%m-%d %H:%M'):<20}")
+            lines.append("=" * 100)
+            return lines
+
+        self._paginate(sorted_requests, render_page)
         return sorted_requests  # Return the sorted list for processing
 
     # This method was incorrectly indented before
@@ -1399,7 +3261,7 @@ class EmployeeManagementSystem:
         self._handle_request_processing(request)
 
     def _process_by_type(self):
-        types = sorted(set(req.request_type for req in self.request_queue.requests))
+        types = self.request_queue.get_types()
         if not types:
             print(Fore.YELLOW + "\nNo request types available!" + Style.RESET_ALL)
             return
@@ -1416,11 +3278,11 @@ class EmployeeManagementSystem:
                 selected_type = types[choice - 1]
                 requests = self.request_queue.filter_requests(filter_type=selected_type)
                 if requests:
-                    self._display_request_list(requests, f"Requests of type: {selected_type}")
+                    requests = self._display_request_list(requests, f"Requests of type: {selected_type}")
                     req_num = int(self.get_input("Enter request number to process (0 to cancel): "))
                     if 1 <= req_num <= len(requests):
                         request = requests[req_num - 1]
-                        self.request_queue.requests.remove(request)
+                        self.request_queue.remove_request(request)
                         self._handle_request_processing(request)
                 else:
                     print(Fore.YELLOW + f"\nNo {selected_type} requests found!" + Style.RESET_ALL)
@@ -1442,7 +3304,7 @@ class EmployeeManagementSystem:
                 return
             if 1 <= choice <= len(displayed_requests):
                 request = displayed_requests[choice - 1]
-                self.request_queue.requests.remove(request)
+                self.request_queue.remove_request(request)
                 self._handle_request_processing(request)
             else:
                 print(Fore.RED + "Invalid request number!" + Style.RESET_ALL)
@@ -1477,6 +3339,7 @@ class EmployeeManagementSystem:
         request.processed_time = datetime.datetime.now()
         self._update_request_stats(request, approved=True)
         self._log_request(request, "APPROVED")
+        self._journal_request_processed(request)
 
         # Send approval notification
         self._send_request_notification(
@@ -1529,6 +3392,7 @@ class EmployeeManagementSystem:
             )
 
             self._log_request(request, "REJECTED")
+            self._journal_request_processed(request)
             return True
 
         except ValueError as e:
@@ -1542,7 +3406,7 @@ class EmployeeManagementSystem:
 
     def _send_request_notification(self, request, action, subject, message_template):
         """Send email notification for request actions"""
-        employee = next((emp for emp in self.employees if emp.employee_id == request.employee_id), None)
+        employee = self.get_employee(request.employee_id)
         if not employee:
             print(Fore.RED + "Employee not found - cannot send notification" + Style.RESET_ALL)
             return False
@@ -1555,10 +3419,6 @@ class EmployeeManagementSystem:
         return True
 
     def _send_email(self, recipient_email, subject, message_body):
-        from google.oauth2.credentials import Credentials
-        from google_auth_oauthlib.flow import InstalledAppFlow
-        from googleapiclient.discovery import build
-        from google.auth.transport.requests import Request
         """Send email using Gmail API with proper authentication"""
         try:
             # Validate email format
@@ -1569,16 +3429,16 @@ class EmployeeManagementSystem:
             # Set up Gmail API credentials
             creds = None
             if os.path.exists('token.json'):
-                creds = Credentials.from_authorized_user_file('token.json', SCOPES)
+                creds = _google_credentials.Credentials.from_authorized_user_file('token.json', SCOPES)
 
             if not creds or not creds.valid:
                 if creds and creds.expired and creds.refresh_token:
-                    creds.refresh(Request())
+                    creds.refresh(_google_transport.Request())
                 else:
                     if not os.path.exists('credentials.json'):
                         print(Fore.RED + "Missing credentials.json! Cannot send email." + Style.RESET_ALL)
                         return False
-                    flow = InstalledAppFlow.from_client_secrets_file(
+                    flow = _google_oauth_flow.InstalledAppFlow.from_client_secrets_file(
                         'credentials.json', SCOPES)
                     creds = flow.run_local_server(port=0)
 
@@ -1586,7 +3446,7 @@ class EmployeeManagementSystem:
                     token.write(creds.to_json())
 
             # Create and send email
-            service = build('gmail', 'v1', credentials=creds)
+            service = _google_discovery.build('gmail', 'v1', credentials=creds)
             message = MIMEText(message_body)
             message['to'] = recipient_email
             message['subject'] = subject
@@ -1651,230 +3511,164 @@ class EmployeeManagementSystem:
             self.employees = []
             self.requests = []
 
+    def _dashboard_metrics(self, top=5):
+        """Dashboard figures read from the maintained metrics, queue indexes and request stats"""
+        metrics = self._metrics
+        return {
+            "total_employees": metrics.total_employees,
+            "full_time": metrics.full_time,
+            "part_time": metrics.part_time,
+            "departments": metrics.departments,
+            "top_programmes": metrics.top_programmes(top),
+            "pending": len(self.request_queue),
+            "pending_by_priority": self.request_queue.get_priority_counts(),
+            "processed": self.request_stats['total_processed'],
+        }
+
+    def check_dashboard_metrics(self):
+        """Figures whose maintained value differs from a full recompute (empty when consistent).
+
+        Departments whose tree node holds a different set of employees than
+        self.employees, or whose rollups disagree with their subtree, are
+        reported as "tree:<name>".
+        """
+        mismatched = self.tree.check_rollups()
+        in_tree = defaultdict(set)
+        for emp in self.tree.iter_employees(predicate=lambda emp: not emp.is_admin):
+            in_tree[emp.department].add(emp)
+        expected = defaultdict(set)
+        for emp in self.employees:
+            if not emp.is_admin:
+                expected[emp.department].add(emp)
+        mismatched += sorted(department for department in in_tree.keys() | expected.keys()
+                             if in_tree[department] != expected[department] and department not in mismatched)
+        return self._metrics.check(self.employees) + [f"tree:{name}" for name in mismatched]
+
     def loading_animation(self, message="Loading"):
         """Show a loading animation with a custom message"""
-        import itertools
-        import sys
-        import time
-
-        spinner = itertools.cycle(['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏'])
-        for i in range(3):  # Run for 3 full cycles
-            for _ in range(10):  # Each cycle has 10 spinner frames
-                char = next(spinner)
-                sys.stdout.write(f'\r{message} {char}')
-                sys.stdout.flush()
-                time.sleep(0.1)
-        sys.stdout.write('\r' + ' ' * (len(message) + 4) + '\r')  # Clear the line
+        loading_animation(message)
+
     def _generate_dashboard_pdf(self, filename="dashboard_report.pdf"):
         """Generate PDF dashboard report with employee statistics and charts"""
-
-        # Show loading animation before starting
-        self.loading_animation("Preparing report")
-
         try:
-            # Import required libraries
-            import matplotlib
-            matplotlib.use('Agg')
-            import matplotlib.pyplot as plt
-            from io import BytesIO
-            import pandas as pd
-            from reportlab.lib.pagesizes import landscape, letter
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image
-            from reportlab.lib.styles import getSampleStyleSheet
-            from collections import Counter
-            import datetime
-            import os
-            from matplotlib import rcParams
-
-            # Set font to handle special characters
-            rcParams['font.family'] = 'DejaVu Sans'
-            rcParams['font.sans-serif'] = ['DejaVu Sans']
-
-            # Load data with loading animation
-            self.loading_animation("Loading employee data")
-            try:
-                with open("employees.json", 'r') as f:
-                    data = json.load(f)
-                employees = data.get("employees", [])
-                requests = data.get("requests", [])
-                processed_requests = self._load_processed_requests()
-            except Exception as e:
-                print(f"\nError loading data: {str(e)}")
-                return False
-
             # Prepare data with ASCII-only cleaning
             def clean_text(text):
                 if not isinstance(text, str):
                     return str(text)
                 return text.encode('ascii', 'ignore').decode('ascii')
 
-            # Process employee data with loading feedback
-            print("\nProcessing employee records...")
-            non_admins = [e for e in employees if isinstance(e, dict) and not e.get("is_admin", False)]
-            df_data = []
-
-            for i, e in enumerate(non_admins):
-                # Show progress every 10 records
-                if i % 10 == 0:
-                    sys.stdout.write(f'\rProcessing record')
-                    sys.stdout.flush()
-
-                try:
-                    # Decrypt and clean programs
-                    programmes = []
-                    for p in e.get("programmes", []):
-                        if isinstance(p, str) and p.startswith('enc:'):
-                            try:
-                                decrypted = simple_decrypt(p[4:])
-                                programmes.append(clean_text(decrypted))
-                            except:
-                                programmes.append("[DECRYPTION ERROR]")
-                        else:
-                            programmes.append(clean_text(p))
-
-                    df_data.append({
-                        "name": clean_text(e.get("name", "")),
-                        "is_full_time": bool(e.get("is_full_time", False)),
-                        "programmes": programmes,
-                        "department": clean_text(e.get("department", ""))
-                    })
-                except Exception as e:
-                    continue
-
-            if not df_data:
+            # Calculate statistics from the in-memory model
+            metrics = self._dashboard_metrics()
+            if not metrics["total_employees"]:
                 print("\nNo valid employee data found")
                 return False
 
-            df = pd.DataFrame(df_data)
-            print("\nData processing complete")
-
-            # Calculate statistics with loading animation
-            self.loading_animation("Calculating statistics")
-            total_employees = len(df)
-            full_time_count = df["is_full_time"].sum()
-            part_time_count = total_employees - full_time_count
+            total_employees = metrics["total_employees"]
+            full_time_count = metrics["full_time"]
+            part_time_count = metrics["part_time"]
 
             # Get most common programme
-            all_programmes = [p for sublist in df["programmes"] for p in sublist if isinstance(p, str)]
-            programme_counts = Counter(all_programmes)
-            most_common_programme = programme_counts.most_common(1)[0][0] if programme_counts else "N/A"
+            top_programmes = [(clean_text(name), count) for name, count in metrics["top_programmes"]]
+            most_common_programme = top_programmes[0][0] if top_programmes else "N/A"
 
             # Request statistics
-            pending_requests = len([r for r in requests if isinstance(r, dict)])
-            done_count = len([r for r in processed_requests if isinstance(r, dict)])
-            pending_by_priority = Counter(r.get("priority_level", 0) for r in requests if isinstance(r, dict))
+            pending_requests = metrics["pending"]
+            pending_by_priority = metrics["pending_by_priority"]
+            done_count = metrics["processed"]
 
             # Department statistics
-            departments = [d for d in df["department"] if isinstance(d, str)]
-            unique_departments = len(set(departments))
-
-            # Create PDF document
-            self.loading_animation("Initializing PDF")
+            unique_departments = metrics["departments"]
+
+            # Chart name, data and size in the PDF
+            labels = [f"Priority {k}" for k in sorted(pending_by_priority.keys())]
+            sizes = [pending_by_priority[k] for k in sorted(pending_by_priority.keys())]
+            if done_count > 0:
+                labels.append("Processed")
+                sizes.append(done_count)
+            charts = [("employment", (full_time_count, part_time_count), 400, 250),
+                      ("requests", (labels, sizes), 400, 250)]
+            if top_programmes:
+                charts.append(("programmes", top_programmes, 500, 300))
+
+            # Render the charts in worker processes while the rest of the report is assembled.
+            # Submitting before the spinner thread starts lets new workers fork without it.
             try:
-                doc = SimpleDocTemplate(filename, pagesize=landscape(letter))
-            except Exception as e:
-                print(f"\nError creating PDF document: {str(e)}")
-                return False
-
-            styles = getSampleStyleSheet()
-            story = []
-
-            # Add header
-            story.append(Paragraph("Employee Management Dashboard", styles['Title']))
-            story.append(Spacer(1, 12))
-
-            # Add summary statistics
-            stats = [
-                f"Total Employees: {total_employees}",
-                f"Full-time: {full_time_count} | Part-time: {part_time_count}",
-                f"Most Common Programme: {most_common_programme}",
-                f"Pending Requests: {pending_requests}",
-                f"Processed Requests: {done_count}",
-                f"Total Departments: {unique_departments}",
-                f"Report Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}"
-            ]
-
-            for stat in stats:
-                story.append(Paragraph(stat, styles['Normal']))
-                story.append(Spacer(1, 6))
-
-            story.append(Spacer(1, 24))
-
-            # Generate charts with progress feedback
-            print("\nGenerating charts:")
+                pool = _dashboard_chart_pool()
+                renders = [pool.submit(_render_dashboard_chart, chart, data)
+                           for chart, data, _, _ in charts]
+            except (OSError, NotImplementedError, BrokenProcessPool):
+                # No usable worker processes; render in this process below
+                _reset_dashboard_chart_pool()
+                pool = None
+
+            with ProgressIndicator("Preparing report") as progress:
+                from io import BytesIO
+                landscape, letter = _reportlab_pagesizes.landscape, _reportlab_pagesizes.letter
+                SimpleDocTemplate, Paragraph = _reportlab_platypus.SimpleDocTemplate, _reportlab_platypus.Paragraph
+                Spacer, Image = _reportlab_platypus.Spacer, _reportlab_platypus.Image
+                getSampleStyleSheet = _reportlab_styles.getSampleStyleSheet
+
+                # Create PDF document
+                progress.stage("Initializing PDF")
+                try:
+                    doc = SimpleDocTemplate(filename, pagesize=landscape(letter))
+                except Exception as e:
+                    progress.print(f"\nError creating PDF document: {str(e)}")
+                    return False
 
-            # Chart 1: Employment Type Breakdown
-            print("- Employment distribution chart")
-            try:
-                fig1, ax1 = plt.subplots()
-                ax1.bar(['Full-Time', 'Part-Time'], [full_time_count, part_time_count],
-                        color=['#4CAF50', '#FFC107'])
-                ax1.set_title("Employment Type Distribution")
-                img1 = BytesIO()
-                plt.tight_layout()
-                fig1.savefig(img1, format='png', dpi=100)
-                plt.close(fig1)
-                img1.seek(0)
-                story.append(Image(img1, width=400, height=250))
-                story.append(Spacer(1, 12))
-            except Exception as e:
-                print(f"Error creating employment chart: {str(e)}")
+                styles = getSampleStyleSheet()
+                story = []
 
-            # Chart 2: Requests by Priority
-            print("- Request status chart")
-            try:
-                labels = [f"Priority {k}" for k in sorted(pending_by_priority.keys())]
-                sizes = [pending_by_priority[k] for k in sorted(pending_by_priority.keys())]
-
-                if done_count > 0:
-                    labels.append("Processed")
-                    sizes.append(done_count)
-
-                fig2, ax2 = plt.subplots()
-                ax2.pie(sizes, labels=labels, autopct='%1.1f%%',
-                        colors=plt.cm.tab20.colors[:len(labels)])
-                ax2.set_title("Request Status")
-                img2 = BytesIO()
-                plt.tight_layout()
-                fig2.savefig(img2, format='png', dpi=100)
-                plt.close(fig2)
-                img2.seek(0)
-                story.append(Image(img2, width=400, height=250))
+                # Add header
+                story.append(Paragraph("Employee Management Dashboard", styles['Title']))
                 story.append(Spacer(1, 12))
-            except Exception as e:
-                print(f"Error creating requests chart: {str(e)}")
 
-            # Chart 3: Programme Popularity
-            if programme_counts and len(programme_counts) > 0:
-                print("- Programme popularity chart")
+                # Add summary statistics
+                stats = [
+                    f"Total Employees: {total_employees}",
+                    f"Full-time: {full_time_count} | Part-time: {part_time_count}",
+                    f"Most Common Programme: {most_common_programme}",
+                    f"Pending Requests: {pending_requests}",
+                    f"Processed Requests: {done_count}",
+                    f"Total Departments: {unique_departments}",
+                    f"Report Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}"
+                ]
+
+                for stat in stats:
+                    story.append(Paragraph(stat, styles['Normal']))
+                    story.append(Spacer(1, 6))
+
+                story.append(Spacer(1, 24))
+
+                # Collect the charts in report order
+                progress.stage("Generating charts")
+                for i, (chart, data, width, height) in enumerate(charts):
+                    try:
+                        png = None
+                        if pool:
+                            try:
+                                png = renders[i].result()
+                            except BrokenProcessPool:
+                                # A worker died; finish this and the remaining charts here
+                                _reset_dashboard_chart_pool()
+                                pool = None
+                        if png is None:
+                            png = _render_dashboard_chart(chart, data)
+                        story.append(Image(BytesIO(png), width=width, height=height))
+                        if chart != "programmes":
+                            story.append(Spacer(1, 12))
+                    except Exception as e:
+                        progress.print(f"Error creating {chart} chart: {str(e)}")
+
+                progress.stage("Generating final PDF")
                 try:
-                    top_programmes = programme_counts.most_common(5)
-                    top_programmes = [(clean_text(name), count) for name, count in top_programmes]
-
-                    fig3, ax3 = plt.subplots(figsize=(8, 4))
-                    ax3.bar([p[0] for p in top_programmes], [p[1] for p in top_programmes],
-                            color=plt.cm.tab20.colors[:5])
-                    ax3.set_title("Top 5 Programmes")
-                    ax3.set_ylabel("Enrollments")
-                    plt.xticks(rotation=45, ha='right')
-                    img3 = BytesIO()
-                    plt.tight_layout()
-                    fig3.savefig(img3, format='png', dpi=100)
-                    plt.close(fig3)
-                    img3.seek(0)
-                    story.append(Image(img3, width=500, height=300))
+                    doc.build(story)
                 except Exception as e:
-                    print(f"Error creating programmes chart: {str(e)}")
+                    progress.print(f"\nError building PDF: {str(e)}")
+                    return False
 
-            # Build PDF with loading animation
-            self.loading_animation("Generating final PDF")
-            try:
-                doc.build(story)
-                print(f"\nPDF successfully generated: {os.path.abspath(filename)}")
-                return True
-            except Exception as e:
-                print(f"\nError building PDF: {str(e)}")
-                return False
+            print(f"\nPDF successfully generated: {os.path.abspath(filename)}")
+            return True
 
         except Exception as e:
             print(f"\nUnexpected error in PDF generation: {str(e)}")
@@ -1883,63 +3677,28 @@ class EmployeeManagementSystem:
     def dashboard_summary(self):
         """Display comprehensive dashboard summary and handle PDF generation"""
         try:
-            # Load data with error handling
-            try:
-                with open("employees.json", 'r') as f:
-                    data = json.load(f)
-                employees = data.get("employees", [])
-                requests = data.get("requests", [])
-                processed_requests = self._load_processed_requests()
-            except Exception as e:
-                print(Fore.RED + f"\nError loading data: {str(e)}" + Style.RESET_ALL)
-                return
-
-            # Filter out admins and invalid entries
-            non_admins = [e for e in employees if isinstance(e, dict) and not e.get("is_admin", False)]
-            total_employees = len(non_admins)
+            metrics = self._dashboard_metrics()
+            total_employees = metrics["total_employees"]
 
-            if not non_admins:
+            if not total_employees:
                 print(Fore.YELLOW + "\nNo employee data found" + Style.RESET_ALL)
                 return
 
             # Employment statistics
-            full_time_count = sum(1 for e in non_admins if e.get("is_full_time", False))
-            part_time_count = total_employees - full_time_count
-
-            from collections import Counter
-
-            # Programme statistics - decrypted correctly
-            all_programmes = []
-
-            for e in non_admins:
-                programmes = e.get("programmes", [])
-                if isinstance(programmes, list):
-                    for p in programmes:
-                        if isinstance(p, str):
-                            if p.startswith("enc:"):
-                                try:
-                                    decrypted = simple_decrypt(p[4:])
-                                    all_programmes.append(decrypted)
-                                except Exception as err:
-                                    all_programmes.append("[DECRYPTION ERROR]")
-                            else:
-                                all_programmes.append(p)
-
-            # Count only valid decrypted programmes
-            valid_programmes = [p for p in all_programmes if p and p != "[DECRYPTION ERROR]"]
-            programme_counts = Counter(valid_programmes)
-            most_common = programme_counts.most_common(1)
+            full_time_count = metrics["full_time"]
+            part_time_count = metrics["part_time"]
 
+            # Programme statistics
+            most_common = metrics["top_programmes"]
             most_common_programme = most_common[0][0] if most_common else "N/A"
             programme_count = most_common[0][1] if most_common else 0
 
             # Request statistics
-            pending_requests = len([r for r in requests if isinstance(r, dict)])
-            done_count = len([r for r in processed_requests if isinstance(r, dict)])
+            pending_requests = metrics["pending"]
+            done_count = metrics["processed"]
 
             # Department statistics
-            departments = {e.get("department", "Unknown") for e in non_admins}
-            dept_count = len(departments)
+            dept_count = metrics["departments"]
 
             # Display dashboard
             self.display_header("DASHBOARD SUMMARY")
@@ -1968,11 +3727,25 @@ class EmployeeManagementSystem:
 
 
 if __name__ == "__main__":
+    # --import-profile prints how long each deferred import took when the program exits
+    if "--import-profile" in sys.argv:
+        atexit.register(print_import_profile)
     system = EmployeeManagementSystem()
+    # --structured-log=jsonl or --structured-log=binary also writes decisions in that format
+    for arg in sys.argv[1:]:
+        if arg.startswith("--structured-log="):
+            log_format = arg.partition("=")[2]
+            if log_format in ("jsonl", "binary"):
+                system.structured_log_format = log_format
+            else:
+                print(Fore.RED + f"Unknown structured log format: {log_format}" + Style.RESET_ALL)
     while True:
         if system.login():
             break
         print(Fore.RED + "Login failed. Please try again." + Style.RESET_ALL)
+    # Reports and emails are admin features; warming them up for staff would only cost them
+    if system.current_user.is_admin and "--no-warm-up" not in sys.argv:
+        warm_up_imports()  # Reports and emails then start without import delays
 
     # Main menu loop (only after successful login)
     while True:
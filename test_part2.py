@@ -0,0 +1,256 @@
+import datetime
+import os
+import shutil
+import sys
+
+import pytest
+
+import part2
+from part2 import EmployeeManagementSystem, EmployeeRequest, SegmentedRequestLog
+
+
+def _processed(when, employee_id=10001, status="APPROVED"):
+    request = EmployeeRequest(employee_id, "IT", 2, "Laptop")
+    line = (f"{when:%Y-%m-%d %H:%M:%S.%f}: {status}: Employee ID: {employee_id}, Type: IT, Priority: 2, "
+            f"Details: Laptop, Status: {status}, Timestamp: {request.timestamp}\n")
+    record = {'processed_time': when, 'status': status, 'employee_id': employee_id,
+              'request_type': "IT", 'priority': 2, 'details': "Laptop",
+              'original_request_time': request.timestamp}
+    return line, record
+
+
+def test_segment_summary_counts_record_whose_write_flushed(tmp_path):
+    log = SegmentedRequestLog(str(tmp_path / "segments"))
+    first = datetime.datetime(2026, 9, 1, 10, 0)
+    log.append(*_processed(first))
+    # Past the flush interval, so the next write flushes from inside write()
+    log._writer._last_flush -= log._writer.flush_interval
+    log.append(*_processed(first + datetime.timedelta(seconds=3)))
+    log.close()
+
+    [(_, summary)] = SegmentedRequestLog(str(tmp_path / "segments")).segments()
+    assert summary["total"] == 2
+
+
+def test_migrated_log_is_not_counted_twice(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with open("processed_requests.log", "w") as f:
+        for day in (1, 2, 3):
+            f.write(_processed(datetime.datetime(2026, 8, day, 9, 0))[0])
+
+    system = EmployeeManagementSystem()
+    assert system.request_stats['total_processed'] == 3
+    system.migrate_request_log()
+    assert system.request_stats['total_processed'] == 3
+    assert len(system._load_processed_requests()) == 3
+    assert EmployeeManagementSystem().request_stats['total_processed'] == 3
+
+
+def _employee(name, employee_id, department, programmes, is_full_time=True):
+    return part2.Employee(name, employee_id, f"{name}@company.com", department, is_full_time,
+                          programmes=list(programmes))
+
+
+def test_dashboard_metrics_match_full_recompute_after_enrolments():
+    a = _employee("A", 1, "HR", ["X"])
+    b = _employee("B", 2, "IT", ["Y"], is_full_time=False)
+    employees = [a, b]
+    metrics = part2.DashboardMetrics(employees)
+    for emp in employees:
+        emp._observer = metrics.employee_changed
+
+    a.add_training("Z")
+    assert metrics.check(employees) == []
+
+    c = _employee("C", 3, "IT", ["Y", "Z"])
+    employees.append(c)
+    metrics.add_employee(c)
+    c._observer = metrics.employee_changed
+    b.add_training("X")
+    c.add_training("")
+    assert metrics.check(employees) == []
+    assert metrics.top_programmes(3) == [("X", 2), ("Z", 2), ("Y", 2)]
+
+
+def test_import_profile_splits_self_and_cumulative_time():
+    profiler = part2.ImportProfiler()
+    profiler.measure("outer", lambda: profiler.measure("inner", lambda: None))
+    [(inner, inner_self, inner_cum, inner_depth), (outer, outer_self, outer_cum, outer_depth)] = profiler.rows
+    assert (inner, inner_depth, outer, outer_depth) == ("inner", 1, "outer", 0)
+    assert inner_self == inner_cum
+    assert abs(outer_self + inner_cum - outer_cum) < 1e-9
+
+
+def test_forced_numpy_dashboard_counts_raise_without_numpy(monkeypatch):
+    store = part2.EmployeeStore.from_employees([_employee("A", 1, "HR", ["X"])])
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    with pytest.raises(ImportError):
+        store.dashboard_counts(use_numpy=True)
+    assert store.dashboard_counts()["total_employees"] == 1
+
+
+def test_tree_rollups_follow_inserts_and_removals():
+    tree = part2.EmployeeTree()
+    tree.add_department("Engineering")
+    tree.add_department("Platform", "Engineering")
+    a = _employee("A", 1, "Platform", [])
+    b = _employee("B", 2, "Engineering", [], is_full_time=False)
+    tree.add_employee(a, "Platform")
+    tree.add_employee(b, "Engineering")
+    assert tree.rollup("Engineering") == {"total": 2, "admins": 0, "staff": 2, "full_time": 1, "part_time": 1}
+    assert tree.rollup()["total"] == 3
+
+    tree.remove_employee(a, "Platform")
+    assert tree.rollup("Engineering")["total"] == 1
+    assert tree.rollup("Platform")["total"] == 0
+    assert tree.check_rollups() == []
+
+
+def test_added_employee_joins_the_department_tree(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    system = EmployeeManagementSystem()
+    before = system.tree.rollup()["total"]
+    system.add_employee(_employee("New", 20001, "Research", ["X"]))
+    assert system.tree.rollup()["total"] == before + 1
+    assert system.tree.rollup("Research")["total"] == 1
+
+
+def test_warm_up_falls_back_to_threads_without_worker_processes(monkeypatch):
+    def unavailable(*args, **kwargs):
+        raise NotImplementedError
+
+    monkeypatch.setattr(part2, "ProcessPoolExecutor", unavailable)
+    monkeypatch.setattr(part2, "_chart_pool", None)
+    monkeypatch.setattr(part2, "_WARM_UP_MODULES", ())
+    part2.warm_up_imports().join()
+    assert part2._chart_pool is None
+
+
+def test_importing_part2_leaves_builtin_import_alone():
+    assert part2._import_profiler._original_import is None
+
+
+def test_columnar_views_match_default_views_after_enrolments(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    columnar = EmployeeManagementSystem()
+    columnar.sort_algorithm = "columnar"
+    columnar.add_employee(_employee("Zed", 20001, "Research", ["X", "Y"]))
+    columnar.add_employee(_employee("amy", 20002, "research", []))
+    columnar.get_employee(20001).add_training("Safety")
+
+    store = columnar.employee_store()
+    fresh = part2.EmployeeStore.from_employees(columnar.employees)
+    assert store.programme_offsets == fresh.programme_offsets
+    assert [store.programmes_of(row) for row in range(len(store))] == \
+        [fresh.programmes_of(row) for row in range(len(fresh))]
+
+    views = columnar._ensure_views()
+    columnar.get_employee(20002).add_training("Y")  # Maintained incrementally from here on
+    columnar.sort_algorithm = "timsort"
+    columnar._views = None
+    expected = columnar._ensure_views()
+    assert views["department_name"].items() == expected["department_name"].items()
+    assert views["programmes_desc"].items() == expected["programmes_desc"].items()
+    assert {d: v.items() for d, v in views["departments"].items()} == \
+        {d: v.items() for d, v in expected["departments"].items()}
+
+
+def test_merged_department_partitions_match_a_full_sort(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    system = EmployeeManagementSystem()
+    for i, (department, programmes) in enumerate([("HR", "ab"), ("IT", ""), ("HR", ""), ("Ops", "abc"),
+                                                  ("IT", "ab"), ("Ops", "a")]):
+        system.add_employee(_employee(f"E{i}", 20010 - i, department, programmes))
+    system._ensure_views()
+    system.get_employee(20009).add_training("c")
+
+    staff = [emp for emp in system.employees if not emp.is_admin]
+    expected = sorted(staff, key=lambda emp: (len(emp.programmes), emp.employee_id))
+    assert system.merge_sort_by_programmes() == expected
+    assert system.merge_sort_by_programmes(staff) == expected
+
+
+def test_dashboard_metrics_and_tree_stay_consistent_with_the_employee_list(tmp_path, monkeypatch):
+    shutil.copy(os.path.join(os.path.dirname(__file__), "employees.json"), tmp_path)
+    monkeypatch.chdir(tmp_path)
+    system = EmployeeManagementSystem()
+    assert system.employees
+    assert system.check_dashboard_metrics() == []
+
+    system.add_employee(_employee("New", 20001, "Research", ["X"]))
+    system.add_employee(_employee("Other", 20002, "HR", [], is_full_time=False))
+    system.get_employee(20002).add_training("X")
+    assert system.check_dashboard_metrics() == []
+
+    system.tree.remove_employee(system.get_employee(20001), "Research")
+    assert system.check_dashboard_metrics() == ["tree:Research"]
+
+
+def _write_text_log(path, records):
+    with open(path, "w") as f:
+        for line, _ in records:
+            f.write(line)
+
+
+def _request_records():
+    base = datetime.datetime(2026, 9, 1, 10, 0)
+    records = [_processed(base + datetime.timedelta(minutes=i), 10001 + i, status)
+               for i, status in enumerate(["APPROVED", "REJECTED", "APPROVED"])]
+    long_type = "Maintenance-very-long-type"
+    records[1] = (records[1][0].replace("Type: IT", f"Type: {long_type}"), dict(records[1][1], request_type=long_type))
+    records[2] = (records[2][0].replace("Type: IT", "Type: Maintenance-very"),
+                  dict(records[2][1], request_type="Maintenance-very"))
+    return records
+
+
+def test_binary_request_log_round_trips_long_request_types(tmp_path):
+    records = _request_records()
+    _write_text_log(tmp_path / "processed.log", records)
+    assert part2.convert_text_log(str(tmp_path / "processed.log"), str(tmp_path / "processed.bin"), "binary") == 3
+
+    with part2.BinaryRequestLog(str(tmp_path / "processed.bin")) as log:
+        assert len(log) == 3
+        assert log.column("request_type") == ["IT", "Maintenance-very-long-type", "Maintenance-very"]
+        assert log.column("employee_id") == [10001, 10002, 10003]
+        assert log.column("approved") == [True, False, True]
+        decoded = log.record(1)
+    expected = records[1][1]
+    for name in ("processed_time", "original_request_time", "employee_id", "priority", "request_type", "details"):
+        assert decoded[name] == expected[name]
+
+
+def test_binary_request_types_survive_a_reopened_table(tmp_path):
+    table = part2.RequestTypeTable(str(tmp_path / "log.bin.types"))
+    assert [table.code(t) for t in ("IT", "Others: a\nb", "IT")] == [0, 1, 0]
+    with open(tmp_path / "log.bin.types", "ab") as f:
+        f.write(b'"torn')  # A crash mid-append leaves an unterminated line
+    reopened = part2.RequestTypeTable(str(tmp_path / "log.bin.types"))
+    assert reopened.names == ["IT", "Others: a\nb"]
+    assert reopened.code("Support") == 2
+    assert part2.RequestTypeTable(str(tmp_path / "log.bin.types")).names == ["IT", "Others: a\nb", "Support"]
+
+
+def test_jsonl_request_log_round_trips(tmp_path):
+    records = _request_records()
+    _write_text_log(tmp_path / "processed.log", records)
+    assert part2.convert_text_log(str(tmp_path / "processed.log"), str(tmp_path / "processed.jsonl")) == 3
+    assert list(part2.read_jsonl_log(str(tmp_path / "processed.jsonl"))) == [record for _, record in records]
+
+
+def test_closed_request_log_writers_leave_no_exit_hooks(tmp_path, monkeypatch):
+    hooks = []
+    monkeypatch.setattr(part2.atexit, "register", hooks.append)
+    monkeypatch.setattr(part2.atexit, "unregister", hooks.remove)
+    log = SegmentedRequestLog(str(tmp_path / "segments"), "daily")
+    for day in (1, 2, 3):
+        log.append(*_processed(datetime.datetime(2026, 9, day, 10, 0)))
+    assert len(hooks) == 1  # Only the current segment's writer
+    log.close()
+    assert hooks == []
+
+
+def test_loading_animation_draws_and_clears_the_spinner(capsys):
+    part2.loading_animation("Saving", duration=0.15)
+    out = capsys.readouterr().out
+    assert "Saving ⠋" in out
+    assert out.endswith("\r")